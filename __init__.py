@@ -1,76 +1,221 @@
+import asyncio
 import os
-import re
-from typing import Dict, List, Optional, Tuple, Any
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, \
+    TimeoutError as FutureTimeoutError, wait
+from itertools import islice
+from queue import Queue
+from threading import Event, Lock, Thread
+from typing import TYPE_CHECKING, Dict, Deque, Generator, Iterable, Iterator, List, Optional, Tuple, Any, Union
 from ovos_plugin_manager.templates.language import LanguageTranslator, LanguageDetector
 
 from ovos_bus_client.session import SessionManager, Session
-from ovos_bus_client.message import Message
+from ovos_bus_client.message import Message, dig_for_message
 from ovos_plugin_manager.templates.solvers import QuestionSolver
 from ovos_utils.log import LOG
 from ovos_workshop.decorators import intent_handler, common_query
+from ovos_workshop.intents import IntentBuilder
 from ovos_workshop.skills.ovos import OVOSSkill
-from padacioso import IntentContainer
-from padacioso.bracket_expansion import expand_parentheses
-from pywikihow import WikiHow
-from quebra_frases import sentence_tokenize
 
+from .article import Article, Step
+from .cache import ArticleCache, TranslationCache, article_fetches, cache_key, get_article
+from .images import ImageCache
+from .keywords import KeywordExtractor, find_locale_file
+from .offline import OfflineWikiHow
+from .prefetch import Prefetcher
+from .ranking import confidence, score_article, title_score
+from .metrics import Metrics
+from . import net
+from .search import LazyHowTo, SearchResult, fetch_article, search_results
+from .sessions import ReadingSteps, SessionStore
+from .spoken import normalize_text
+from .workers import ParserPool
 
+if TYPE_CHECKING:
+    from pywikihow import WikiHow
 
-def _normalize_text(text: str) -> str:
+
+def configure_http(config: Dict[str, Any]) -> None:
     """
-    Normalize the input text by removing content inside curly braces {}, square brackets [], parentheses (),
-    HTML tags, and URLs. Strips leading/trailing whitespace.
+    Configure the keep-alive HTTP session shared by the skill and the solver.
+
+    Args:
+        config (Dict[str, Any]): Skill settings or solver config.
+    """
+    net.configure(**http_config(config))
+
 
+def http_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
     Args:
-        text (str): Input text to normalize.
+        config (Dict[str, Any]): Skill settings or solver config.
 
     Returns:
-        str: Normalized text.
+        Dict[str, Any]: Keyword arguments of ``net.configure``.
     """
-    text = re.sub(r"\{.*?\}|\[.*?\]|\(.*?\)|<.*?>", "", text)
-    text = re.sub(r"http\S+|www\S+", "", text)
-    return text.strip()
+    return {"pool_size": config.get("http_pool_size", net.DEFAULT_POOL_SIZE),
+            "connect_timeout": config.get("http_connect_timeout", net.DEFAULT_CONNECT_TIMEOUT),
+            "read_timeout": config.get("http_read_timeout", net.DEFAULT_READ_TIMEOUT),
+            "retries": config.get("http_retries", net.DEFAULT_RETRIES),
+            "backoff_factor": config.get("http_backoff", net.DEFAULT_BACKOFF)}
+
+
+def load_offline_index(config: Dict[str, Any]) -> Optional[OfflineWikiHow]:
+    """
+    Open the offline WikiHow index, if configured.
+
+    Args:
+        config (Dict[str, Any]): Skill settings or solver config.
+
+    Returns:
+        Optional[OfflineWikiHow]: The offline index, None if offline mode is not configured.
+    """
+    path = config.get("offline_index")
+    if not path:
+        return None
+    if not os.path.isdir(path):
+        LOG.error(f"WikiHow offline index not found: {path}")
+        return None
+    return OfflineWikiHow(path, min_coverage=config.get("offline_min_coverage", 0.35))
+
+
+def load_article_cache(config: Dict[str, Any]) -> ArticleCache:
+    """
+    Get the article cache shared by the skill and the solver in this process.
+
+    Args:
+        config (Dict[str, Any]): Skill settings or solver config.
+
+    Returns:
+        ArticleCache: The shared cache, with the largest limits configured by either of them.
+    """
+    return ArticleCache.shared(ttl=config.get("cache_ttl", ArticleCache.DEFAULT_TTL),
+                               max_entries=config.get("cache_max_entries", ArticleCache.DEFAULT_MAX_ENTRIES))
+
+
+def load_metrics(config: Dict[str, Any], **kwargs) -> Metrics:
+    """
+    Create the metrics of the skill or the solver, disabled unless the ``metrics`` setting is true.
+    With ``metrics_port`` set they are also served in the Prometheus text format.
+
+    Args:
+        config (Dict[str, Any]): Skill settings or solver config.
+        **kwargs: Passed to Metrics.
+
+    Returns:
+        Metrics: The metrics.
+    """
+    metrics = Metrics(enabled=config.get("metrics", False), **kwargs)
+    metrics.add_collector("single_flight", article_fetches.metrics)
+    if metrics.enabled and config.get("metrics_port"):
+        metrics.serve(config["metrics_port"])
+    return metrics
 
 
 class WikiHowSkill(OVOSSkill):
     TIMEOUT_SECONDS_PER_SENTENCE: int = 30
+    FETCH_TIMEOUT_SECONDS: int = 60
+    RELATED_RESULTS: int = 5  # next ranked search results kept with an article for prefetching
+    CANDIDATES: int = 3  # search results downloaded and ranked per question
+    CQ_CANDIDATES: int = 1  # a common query answer may lose to another skill, only download the top result
+    GOOD_ENOUGH_SCORE: float = 0.8  # stop waiting for the other candidates once the top result scores this high
+    RANK_BUDGET_SECONDS: float = 3.0
 
     def __init__(self, *args, **kwargs) -> None:
         """
         Initialize the WikiHowSkill with necessary attributes and resources.
         """
         super().__init__(*args, **kwargs)
-        self.kw_matchers: Dict[str, IntentContainer] = {}
-        self.session_results: Dict[str, Dict] = {}  # session_id: {}
+        self.kw_matchers: Dict[str, KeywordExtractor] = {}
+        self.kw_files: Dict[str, str] = {}  # lang: howto.intent path
+        self._kw_lock: Lock = Lock()
+        configure_http(self.settings)
+        self.offline: Optional[OfflineWikiHow] = load_offline_index(self.settings)
+        self.session_results: SessionStore = SessionStore(
+            ttl=self.settings.get("session_ttl", SessionStore.DEFAULT_TTL),
+            max_entries=self.settings.get("max_sessions", SessionStore.DEFAULT_MAX_ENTRIES),
+            on_remove=self._session_removed)
         self.speaking: bool = False  # for stop handling
         self.stop_signaled: bool = False
-        self.wikihow: WikiHow = WikiHow()
+        self._wikihow: Optional["WikiHow"] = None
+        self.cache: ArticleCache = load_article_cache(self.settings)
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=self.settings.get("max_workers", 4), thread_name_prefix="wikihow")
+        self.tx_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=self.settings.get("max_tx_workers", 4), thread_name_prefix="wikihow-tx")
+        # candidates are downloaded from executor threads, a separate pool can not deadlock
+        self.fetch_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max(self.candidates, self.cq_candidates, 1), thread_name_prefix="wikihow-fetch")
+        self.tx_cache: TranslationCache = TranslationCache()
+        self.metrics: Metrics = load_metrics(self.settings, on_span=self._emit_span)
+        self.metrics.add_collector("sessions", self.session_results.metrics)
+        self.images: Optional[ImageCache] = None
+        if self.settings.get("image_cache", True):
+            self.images = ImageCache(
+                size=(self.settings.get("image_width", ImageCache.DEFAULT_SIZE[0]),
+                      self.settings.get("image_height", ImageCache.DEFAULT_SIZE[1])),
+                max_bytes=self.settings.get("image_cache_mb", 50) * 1024 * 1024)
+        self.prefetcher: Optional[Prefetcher] = None
+        if self.settings.get("prefetch", False):
+            self.prefetcher = Prefetcher(
+                self._prefetch_article,
+                max_articles=self.settings.get("prefetch_max", Prefetcher.DEFAULT_MAX_ARTICLES),
+                max_workers=self.settings.get("prefetch_workers", Prefetcher.DEFAULT_MAX_WORKERS),
+                max_bytes_per_minute=self.settings.get("prefetch_kb_per_minute", 2048) * 1024)
+            self.metrics.add_collector("prefetch", self.prefetcher.metrics)
+        self.add_event("ovos.wikihow.metrics", self.handle_metrics_request)
         self.register_kw_xtract()
 
+    @property
+    def candidates(self) -> int:
+        """ search results downloaded and ranked per question """
+        return self.settings.get("candidates", self.CANDIDATES)
+
+    @property
+    def cq_candidates(self) -> int:
+        """ search results downloaded and ranked per common query """
+        return self.settings.get("cq_candidates", self.CQ_CANDIDATES)
+
+    @property
+    def wikihow(self) -> "WikiHow":
+        """ pywikihow client, imported on first use """
+        if self._wikihow is None:
+            from pywikihow import WikiHow
+            self._wikihow = WikiHow()
+        return self._wikihow
+
     def register_kw_xtract(self) -> None:
         """
-        Register keyword extractors for each language by loading patterns from how-to intent files.
-        Uses Padacioso to manage keyword matching.
+        Register the how-to intent file of each language, keyword extractors are only
+        built the first time a language is used.
         """
         for lang in self.native_langs:
             filename = f"{self.root_dir}/locale/{lang.lower()}/howto.intent"
             if not os.path.isfile(filename):
                 LOG.warning(f"{filename} not found! wikihow common QA will be disabled for '{lang}'")
                 continue
-            samples: List[str] = []
-            with open(filename) as f:
-                for line in f.read().split("\n"):
-                    if not line.strip() or line.startswith("#"):
-                        continue
-                    if "(" in line:
-                        samples += expand_parentheses(line)
-                    else:
-                        samples.append(line)
-
-            lang = lang.split("-")[0]
-            if lang not in self.kw_matchers:
-                self.kw_matchers[lang] = IntentContainer()
-            self.kw_matchers[lang].add_intent("question", samples)
+            self.kw_files.setdefault(lang.split("-")[0], filename)
+
+    def get_kw_matcher(self, lang: str) -> Optional[KeywordExtractor]:
+        """
+        Get the keyword extractor for a language, compiling it from the how-to intent file
+        templates into a single regex on first use.
+
+        Args:
+            lang (str): The language of the keyword extractor.
+
+        Returns:
+            Optional[KeywordExtractor]: The keyword extractor, None if the language is not supported.
+        """
+        lang = lang.split("-")[0]
+        if lang not in self.kw_matchers:
+            if lang not in self.kw_files:
+                return None
+            with self._kw_lock:
+                if lang not in self.kw_matchers:
+                    self.kw_matchers[lang] = KeywordExtractor.from_file(self.kw_files[lang])
+        return self.kw_matchers[lang]
 
     def extract_keyword(self, utterance: str, lang: str) -> Optional[str]:
         """
@@ -83,108 +228,614 @@ class WikiHowSkill(OVOSSkill):
         Returns:
             Optional[str]: Extracted keyword if available, otherwise None.
         """
-        lang = lang.split("-")[0]
         # TODO - closest lang / dialect support
-        if lang not in self.kw_matchers:
+        matcher = self.get_kw_matcher(lang)
+        if matcher is None:
             return None
-        matcher: IntentContainer = self.kw_matchers[lang]
-        match = matcher.calc_intent(utterance)
-        kw = match.get("entities", {}).get("query")
+        with self.metrics.span("keyword", lang=lang):
+            kw = matcher.extract(utterance)
         if kw:
-            LOG.debug(f"WikiHow Keyword: {kw} - Confidence: {match['conf']}")
+            LOG.debug(f"WikiHow Keyword: {kw}")
         else:
             LOG.debug(f"Could not extract search keyword for '{lang}' from '{utterance}'")
         return kw
 
     # wikihow internals
-    def _tx(self, data: Dict) -> Dict:
+    def _wikihow_lang(self, lang: str) -> Tuple[str, bool]:
         """
-        Translate WikiHow content (title, steps) into the target language using the skill's translator.
+        Get the WikiHow language to search in for a given target language.
 
         Args:
-            data (Dict): WikiHow content in dictionary format.
+            lang (str): The target language.
 
         Returns:
-            Dict: Translated WikiHow content.
+            Tuple[str, bool]: The WikiHow language, and whether results need to be translated.
+        """
+        lang = lang.split("-")[0]
+        if lang not in self.wikihow.lang2url:
+            return "en", True
+        return lang, False
+
+    def _translate_segments(self, texts: List[str], lang: str) -> List[str]:
         """
-        translated = self.translator.translate(data["title"], self.lang)
-        data["title"] = translated
+        Translate a list of texts, reusing memoized translations.
 
-        for idx, step in enumerate(data["steps"]):
-            translated = self.translator.translate(step["summary"],
-                                                   self.lang)
-            data["steps"][idx]["summary"] = translated
+        Missing translations are sent in a single batch if the translator plugin implements
+        ``translate_list``, otherwise they are translated concurrently in a bounded thread pool.
 
-            translated = self.translator.translate(step["description"],
-                                                   self.lang)
-            data["steps"][idx]["description"] = translated
-        return data
+        Args:
+            texts (List[str]): The texts to translate.
+            lang (str): The target language.
 
-    def get_how_to(self, query: str, num: int = 1) -> Optional[Dict]:
+        Returns:
+            List[str]: The translations, in the same order as texts.
         """
-        Search for a how-to guide on WikiHow and return the result.
+        translated: Dict[str, str] = {}
+        missing: List[str] = []
+        for text in texts:
+            if not text or text in translated or text in missing:
+                continue
+            memo = self.tx_cache.get(text, lang)
+            if memo is None:
+                missing.append(text)
+            else:
+                translated[text] = memo
+
+        if missing:
+            LOG.debug(f"Translating {len(missing)} WikiHow segments to '{lang}'")
+            batched = getattr(type(self.translator), "translate_list", None)
+            with self.metrics.span("translate", lang=lang, segments=len(missing)):
+                if batched is not None and batched is not LanguageTranslator.translate_list:
+                    results = self.translator.translate_list(list(missing), lang_tgt=lang, lang_src="en")
+                else:
+                    results = list(self.tx_executor.map(
+                        lambda t: self.translator.translate(t, lang), missing))
+            for text, result in zip(missing, results):
+                self.tx_cache.put(text, lang, result)
+                translated[text] = result
+
+        return [translated.get(text, text) for text in texts]
+
+    def _tx_step(self, step: Step, lang: str) -> Step:
+        """
+        Translate a single WikiHow step.
+
+        Args:
+            step (Step): The step.
+            lang (str): The target language.
+
+        Returns:
+            Step: A translated copy of the step.
+        """
+        summary, description = self._translate_segments([step.summary, step.description], lang)
+        return step.replace(summary=summary, description=description)
+
+    def _tx_steps(self, steps: Iterable[Step], lang: str, ahead: int = 1) -> Iterator[Step]:
+        """
+        Translate WikiHow steps incrementally, yielding each one as soon as it is translated.
+        The following steps are translated in the background while the caller consumes the current one.
+
+        Args:
+            steps (Iterable[Step]): The steps.
+            lang (str): The target language.
+            ahead (int, optional): Number of steps translated ahead of the consumer. Defaults to 1.
+
+        Yields:
+            Step: Translated copies of the steps, in order.
+        """
+        steps = iter(steps)
+        pending: Deque[Future] = deque(self.executor.submit(self._tx_step, step, lang)
+                                       for step in islice(steps, ahead + 1))
+        try:
+            while pending:
+                step = next(steps, None)
+                if step is not None:
+                    pending.append(self.executor.submit(self._tx_step, step, lang))
+                yield pending.popleft().result(timeout=self.FETCH_TIMEOUT_SECONDS)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _tx(self, data: Article, lang: Optional[str] = None, stream: bool = False) -> Article:
+        """
+        Translate WikiHow content (title, intro, steps) into the target language using the skill's translator.
+        The original article is not changed, translated texts are memoized in ``tx_cache``
+        so translating the same article again does not call the translator.
+
+        Args:
+            data (Article): The WikiHow article.
+            lang (Optional[str], optional): The target language. Defaults to self.lang.
+            stream (bool, optional): Translate title and intro right away and the steps
+                incrementally, while they are read. Defaults to False.
+
+        Returns:
+            Article: The translated article.
+        """
+        lang = lang or self.lang
+        if stream:
+            title, intro = self._translate_segments([data.title, data.intro], lang)
+            steps = ReadingSteps(self._tx_steps(data.steps, lang))
+        else:
+            texts = [data.title, data.intro]
+            for step in data.steps:
+                texts += [step.summary, step.description]
+            texts = self._translate_segments(texts, lang)
+            title, intro = texts[0], texts[1]
+            steps = tuple(step.replace(summary=texts[2 + idx * 2], description=texts[3 + idx * 2])
+                          for idx, step in enumerate(data.steps))
+        return data.replace(title=title, intro=intro, steps=steps)
+
+    def search_how_to(self, query: str, lang: str, max_results: int = -1) -> List[SearchResult]:
+        """
+        Search WikiHow for how-to guides without downloading any article.
 
         Args:
             query (str): The query string to search for.
+            lang (str): The WikiHow language to search in.
+            max_results (int, optional): Maximum number of results, -1 for all. Defaults to -1.
+
+        Returns:
+            List[SearchResult]: Titles and urls of the matching articles.
+        """
+        with self.metrics.span("search", lang=lang):
+            return search_results(query, lang, max_results)
+
+    def _fetch_candidate(self, result: SearchResult) -> Optional[Article]:
+        """
+        Args:
+            result (SearchResult): The search result to download.
+
+        Returns:
+            Optional[Article]: The article, None if the page is not a valid article.
+        """
+        from pywikihow.exceptions import ParseError
+
+        try:
+            with self.metrics.span("fetch", url=result.url):
+                return Article.from_dict(LazyHowTo(result).as_dict())
+        except ParseError:
+            LOG.debug(f"Failed to parse WikiHow article: {result.url}")
+            self.metrics.incr("fetch_failures")
+            return None
+
+    def _fetch_candidates(self, batch: List[SearchResult], query: str, lang: str,
+                          deadline: float) -> List[Tuple[int, Article, float]]:
+        """
+        Download search results concurrently, keeping the ones done before the deadline.
+        Stops waiting as soon as the top search result is in and scores ``GOOD_ENOUGH_SCORE``.
+        If none of them is usable by the deadline, wait for the first one that is.
+
+        Args:
+            batch (List[SearchResult]): The search results to download.
+            query (str): The query the results were searched with.
+            lang (str): The WikiHow language the results were searched in.
+            deadline (float): ``time.monotonic()`` value to stop waiting at.
+
+        Returns:
+            List[Tuple[int, Article, float]]: (position in batch, article, score) for every downloaded article.
+        """
+        if len(batch) == 1:
+            data = self._fetch_candidate(batch[0])
+            return [(0, data, score_article(data, query, lang))] if data is not None else []
+
+        futures = {self.fetch_executor.submit(self._fetch_candidate, r): i for i, r in enumerate(batch)}
+        articles: List[Tuple[int, Article, float]] = []
+        errors: List[BaseException] = []
+
+        def collect(done: Iterable[Future]) -> bool:
+            """ returns True once an article is good enough to stop waiting """
+            for future in done:
+                if future.exception() is not None:
+                    errors.append(future.exception())
+                elif future.result() is not None:
+                    articles.append((futures[future], future.result(),
+                                     score_article(future.result(), query, lang)))
+            return any(idx == 0 and score >= self.GOOD_ENOUGH_SCORE for idx, _, score in articles)
+
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if not done or collect(done):
+                break
+        while not articles and pending:
+            # over budget with nothing usable, take the first article that arrives
+            done, pending = wait(pending, timeout=self.FETCH_TIMEOUT_SECONDS, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            collect(done)
+        for future in pending:
+            LOG.debug(f"WikiHow candidate exceeded the latency budget: {batch[futures[future]].url}")
+            future.cancel()
+        if not articles and errors:
+            raise errors[0]
+        return articles
+
+    def _fetch_article(self, query: str, lang: str,
+                       results: List[SearchResult], num: int = 1) -> Optional[Article]:
+        """
+        Download the top results of a search and cache the one that best answers the query.
+
+        The top ``num`` results are downloaded concurrently within the ``rank_budget`` setting
+        and ranked by how well their title, intro and steps match the query, without waiting
+        for the others once the top result is a good enough match. The next ranked
+        results are kept in the related field of the article, the other downloaded candidates
+        are cached under their titles.
+
+        Args:
+            query (str): The query the results were searched with.
+            lang (str): The WikiHow language the results were searched in.
+            results (List[SearchResult]): The search results, in order.
+            num (int, optional): Number of candidate articles to download. Defaults to 1.
+
+        Returns:
+            Optional[Article]: The article, or None if no article could be parsed.
+        """
+        num = max(1, num)
+        deadline = time.monotonic() + self.settings.get("rank_budget", self.RANK_BUDGET_SECONDS)
+        for start in range(0, len(results), num):
+            batch = results[start:start + num]
+            articles = self._fetch_candidates(batch, query, lang, deadline)
+            if not articles:
+                continue
+            # best score first, search order breaks ties
+            ranked = sorted(articles, key=lambda a: (-a[2], a[0]))
+            for idx, other, _ in ranked[1:]:
+                self.cache.put(batch[idx].title, lang, other)
+            data = ranked[0][1].replace(related=results[start + len(batch):
+                                                        start + len(batch) + self.RELATED_RESULTS])
+            self.cache.put(query, lang, data)
+            return data
+        return None
+
+    def _prefetch_article(self, result: Dict) -> bool:
+        """
+        Download and cache the article of a search result, keyed by its title
+        so asking for it by name is answered from the cache.
+
+        Args:
+            result (Dict): The search result in ``SearchResult.as_dict()`` format.
+
+        Returns:
+            bool: False if the article was already cached.
+        """
+        query, lang = result["title"], result["lang"]
+        if self.cache.has(query, lang):
+            return False
+
+        def fetch() -> Article:
+            with self.metrics.span("prefetch", url=result["url"]):
+                data = Article.from_dict(LazyHowTo(SearchResult(**result)).as_dict())
+            self.cache.put(query, lang, data)
+            return data
+
+        article_fetches.do(cache_key(query, lang), fetch)
+        return True
+
+    def _fetch_how_to(self, query: str, lang: str, num: int = 1,
+                      searched: Optional[Future] = None) -> Optional[Article]:
+        """
+        Search WikiHow for a how-to guide, without translating it.
+        Articles are served from the offline index or the shared on-disk cache when available.
+
+        Args:
+            query (str): The query string to search for.
+            lang (str): The WikiHow language to search in.
             num (int, optional): Maximum number of results to retrieve. Defaults to 1.
+            searched (Optional[Future], optional): Resolved with the search results
+                before the article is downloaded. Defaults to None.
 
         Returns:
-            Optional[Dict]: WikiHow content in dictionary format, or None if no result found.
+            Optional[Article]: The article, or None if no result found.
         """
-        data = None
-        lang = self.lang.split("-")[0]
-        tx = False
-        if lang not in self.wikihow.lang2url:
-            tx = True
-            lang = "en"
-        for how_to in self.wikihow.search(query, max_results=num, lang=lang):
-            data = how_to.as_dict()
-            # translate if lang not supported by wikihpw
-            if tx:
-                data = self._tx(data)
+        return get_article(self.cache, query, lang, self._search_and_fetch, num, searched,
+                           offline=self.offline, offline_only=self.settings.get("offline_only", False),
+                           metrics=self.metrics)
+
+    def _search_and_fetch(self, query: str, lang: str, num: int = 1,
+                          searched: Optional[Future] = None) -> Optional[Article]:
+        results = self.search_how_to(query, lang)
+        if searched is not None:
+            searched.set_result(results)
+        return self._fetch_article(query, lang, results, num)
+
+    def get_how_to(self, query: str, num: int = 1, lang: Optional[str] = None,
+                   stream: bool = False) -> Optional[Article]:
+        """
+        Search for a how-to guide on WikiHow and return the result.
+
+        Args:
+            query (str): The query string to search for.
+            num (int, optional): Number of top results downloaded and ranked. Defaults to 1.
+            lang (Optional[str], optional): The target language. Defaults to self.lang.
+            stream (bool, optional): If the result needs translation, translate the steps
+                incrementally while they are read. Defaults to False.
+
+        Returns:
+            Optional[Article]: The article, or None if no result found.
+        """
+        lang = lang or self.lang
+        wiki_lang, tx = self._wikihow_lang(lang)
+        data = self._fetch_how_to(query, wiki_lang, num)
+        # translate if lang not supported by wikihpw
+        if data is not None and tx:
+            data = self._tx(data, lang, stream)
         return data
 
-    def speak_how_to(self, how_to: Dict, sess: Optional[Session] = None) -> None:
+    def get_how_to_within(self, query: str, lang: str,
+                          deadline: float) -> Tuple[Optional[str], Optional[Union[Article, Future]]]:
         """
-        Speak the steps of a WikiHow guide.
+        Search for a how-to guide on WikiHow, giving up after a deadline.
+
+        If the article is not downloaded in time but the search already returned,
+        the answer is the title of the best result and the article keeps downloading
+        in the background. If not even the search is done, the fetch still completes
+        in the background so the result is cached for the next time it is asked.
+        Steps that need translation are translated incrementally while being read.
 
         Args:
-            how_to (Dict): The WikiHow guide in dictionary format.
+            query (str): The query string to search for.
+            lang (str): The target language.
+            deadline (float): Seconds to wait for the article.
+
+        Returns:
+            Tuple[Optional[str], Optional[Union[Article, Future]]]: The answer, and the
+                article or a future resolving to it. (None, None) if no result in time.
+        """
+        wiki_lang, tx = self._wikihow_lang(lang)
+        searched = Future()
+        fetching = self.executor.submit(self._fetch_how_to, query, wiki_lang, self.cq_candidates, searched)
+        try:
+            data = fetching.result(timeout=deadline)
+        except FutureTimeoutError:
+            data = None
+        except Exception as e:
+            LOG.error(f"WikiHow search failed: {e}")
+            return None, None
+
+        if data is None:
+            if fetching.done() or not searched.done() or not searched.result():
+                LOG.debug(f"WikiHow search exceeded the {deadline}s deadline: {query}")
+                return None, None
+            # answer from the search result while the article downloads
+            answer = searched.result()[0].title
+            if not tx:
+                return answer, fetching
+            answer = self._translate_segments([answer], lang)[0]
+            return answer, self.executor.submit(self._tx_when_done, fetching, lang)
+
+        if tx:
+            data = self._tx(data, lang, stream=True)
+        return data.intro, data
+
+    def _tx_when_done(self, fetching: Future, lang: str) -> Optional[Article]:
+        """
+        Wait for an article being downloaded and translate it incrementally.
+
+        Args:
+            fetching (Future): Future resolving to the untranslated article.
+            lang (str): The target language.
+
+        Returns:
+            Optional[Article]: The translated article, or None if no result found.
+        """
+        data = fetching.result(timeout=self.FETCH_TIMEOUT_SECONDS)
+        if data is None:
+            return None
+        return self._tx(data, lang, stream=True)
+
+    def _step_sentences(self, step: Step) -> List[str]:
+        """
+        Build the list of sentences to speak for a WikiHow step.
+
+        Args:
+            step (Step): The step.
+
+        Returns:
+            List[str]: The normalized sentences of the step.
+        """
+        return step.sentences(self.settings.get("detailed", True))
+
+    def _prepare_steps(self, steps: Iterable[Step], reading: "Queue[Optional[Tuple]]", done: Event,
+                       start: int = 0, pictures: bool = False) -> None:
+        """
+        Producer for read_steps, fills the reading queue with (index, picture, sentences)
+        for every step and a final None, so the reader never waits on text processing,
+        translation or picture downloads between utterances.
+
+        Args:
+            steps (Iterable[Step]): The steps, may be a generator.
+            reading (Queue): The queue consumed by read_steps.
+            done (Event): Set by the reader once it stops reading.
+            start (int): Index of the first step. Defaults to 0.
+            pictures (bool): Download the pictures to the local image cache,
+                picture is then a (url, future) tuple. Defaults to False.
+        """
+        try:
+            for idx, step in enumerate(steps, start):
+                if done.is_set():
+                    break
+                sents = self._step_sentences(step)
+                picture = step.picture
+                if picture and pictures and self.images is not None:
+                    picture = (picture, self.images.prefetch(picture))
+                if sents:
+                    reading.put((idx, picture, sents))
+        except Exception as e:
+            LOG.error(f"Failed to prepare WikiHow steps: {e}")
+        finally:
+            if isinstance(steps, Generator):
+                steps.close()
+            reading.put(None)
+
+    def speak_how_to(self, how_to: Article, sess: Optional[Session] = None) -> None:
+        """
+        Store a WikiHow guide in the session and speak its steps from the start.
+
+        Args:
+            how_to (Article): The WikiHow guide, steps may still be translating.
             sess (Optional[Session], optional): The session to manage during the speaking process. Defaults to None.
         """
         sess = sess or SessionManager.get()
-        title = how_to["title"]
-        total = len(how_to["steps"])
-        LOG.debug(f"HowTo contains {total} steps")
+        # a reader left running would keep reading the old guide into the replaced entry
+        self._interrupt_reading(sess=sess)
+        entry = self.session_results.get(sess.session_id) or {}
+        entry = {k: v for k, v in entry.items() if k not in ("reading", "idle")}
+        self.session_results[sess.session_id] = dict(entry, how_to=how_to, position=0, finished=False)
+
+        if self.prefetcher is not None and how_to.related:
+            # the network is idle while reading, warm the cache for the likely next question
+            self.prefetcher.prefetch(r.as_dict() for r in how_to.related)
+        self.read_steps(sess)
+
+    def read_steps(self, sess: Session, start: int = 0, single: bool = False) -> bool:
+        """
+        Speak the steps of the WikiHow guide stored in the session.
+
+        Text processing runs in a background producer, each utterance is sent as soon
+        as the audio service reports the previous one finished playing. The session keeps
+        the article and the position of the reader, so reading can be resumed after a stop.
+
+        Args:
+            sess (Session): The session whose guide is read.
+            start (int): Index of the first step to read, starting at 0. Defaults to 0.
+            single (bool): Read only that step. Defaults to False.
+
+        Returns:
+            bool: False if the session has no guide to read.
+        """
+        entry = self.session_results.get(sess.session_id)
+        if entry is None or not isinstance(entry.get("how_to"), Article):
+            return False
+        how_to = entry["how_to"]
+        title = how_to.title
+        LOG.debug(f"HowTo contains {how_to.n_steps} steps, reading from {start + 1}")
+
+        entry.setdefault("idle", Event()).clear()
+        entry.update(reading=True, stop_signaled=False)
+
+        def stop_signaled() -> bool:
+            return entry.get("stop_signaled", False)
+
+        steps = how_to.steps.iter_from(start)
+        reading: "Queue[Optional[Tuple]]" = Queue()
+        done = Event()
+        show_pictures = sess.session_id == "default"
+        Thread(target=self._prepare_steps,
+               args=(islice(steps, 1) if single else steps, reading, done, start, show_pictures),
+               daemon=True, name="wikihow-reader").start()
 
         self.set_context("WikiHow", title)
-        for idx, s in enumerate(how_to["steps"]):
-            if self.session_results[sess.session_id].get("stop_signaled"):
+        for idx, picture, sents in iter(reading.get, None):
+            if stop_signaled():
                 LOG.debug(f"Stopping how-to reading for session: {sess.session_id}")
                 break
+            entry.update(position=idx, finished=False)
 
-            if sess.session_id == "default" and s.get("picture"):
-                self.gui.show_image(caption=title, url=s["picture"],
+            if show_pictures and picture:
+                self.gui.show_image(caption=title, url=self._local_picture(picture),
                                     override_idle=True, override_animations=True)
 
-            if self.settings.get("detailed", True):
-                txt = s["summary"] + "\n" + s["description"]
-            else:
-                txt = s["summary"]
-
-            txt = _normalize_text(txt)
-
-            sents = sentence_tokenize(txt)
-            self.speak_dialog("step", {"number": idx + 1, "step": sents[0]}, wait=self.TIMEOUT_SECONDS_PER_SENTENCE)
-            if len(sents) > 1:
-                for s in sents[1:]:
-                    if not self.session_results[sess.session_id].get("stop_signaled"):
-                        self.speak(s, wait=self.TIMEOUT_SECONDS_PER_SENTENCE)
+            with self.metrics.span("step", number=idx + 1, session=sess.session_id):
+                self.speak_dialog("step", {"number": idx + 1, "step": sents[0]},
+                                  wait=self.TIMEOUT_SECONDS_PER_SENTENCE)
+                for sent in sents[1:]:
+                    if stop_signaled():
+                        break
+                    self.speak(sent, wait=self.TIMEOUT_SECONDS_PER_SENTENCE)
+            entry["finished"] = not stop_signaled()
 
         LOG.debug("end of HowTo")
-        self.session_results.pop(sess.session_id)
+        done.set()
+        if entry.get("finished") and how_to.steps.get(entry["position"] + 1) is None:
+            self.remove_context("WikiHow")  # read to the end, step navigation stops matching
+        entry["reading"] = False
+        entry["idle"].set()
+        self.session_results.touch(sess.session_id)  # kept for session_ttl from the end of the reading
         if sess.session_id == "default":
             self.gui.release()
+        return True
+
+    def _local_picture(self, picture: Union[str, Tuple[str, Future]]) -> str:
+        """
+        Args:
+            picture (Union[str, Tuple[str, Future]]): The picture url, or (url, download future) from the image cache.
+
+        Returns:
+            str: Path of the downloaded picture, or its url if it is still downloading, reading never waits for it.
+        """
+        if isinstance(picture, str):
+            return picture
+        url, downloading = picture
+        if not downloading.done() or downloading.cancelled() or downloading.exception() is not None:
+            return url
+        return downloading.result() or url
+
+    def _interrupt_reading(self, message: Optional[Message] = None,
+                           sess: Optional[Session] = None) -> Optional[Dict]:
+        """
+        Stop the reader of the session, if reading, and wait for it to finish.
+
+        Args:
+            message (Optional[Message]): The message that interrupted the reading, the one being handled if None.
+            sess (Optional[Session]): The session to interrupt, the session of message if None.
+
+        Returns:
+            Optional[Dict]: The reading state of the session, None if it has no guide.
+        """
+        message = message or dig_for_message() or Message("")
+        sess = sess or SessionManager.get(message)
+        entry = self.session_results.get(sess.session_id)
+        if entry is None or not isinstance(entry.get("how_to"), Article):
+            return None
+        if entry.get("reading"):
+            entry["stop_signaled"] = True
+            self.metrics.incr("stop_signals")
+            self.bus.emit(message.forward("mycroft.audio.speech.stop"))
+            entry["idle"].wait(self.TIMEOUT_SECONDS_PER_SENTENCE)
+        return entry
+
+    def _session_removed(self, session_id: str, entry: Dict) -> None:
+        """ the guide of an expired or evicted session is gone, step navigation stops matching """
+        self.bus.emit(Message("remove_context", {"context": self.alphanumeric_skill_id + "WikiHow"},
+                              {"session": {"session_id": session_id}, "skill_id": self.skill_id}))
+
+    def _goto_step(self, message: Message, idx: int, single: bool = True) -> None:
+        """
+        Read the guide of the session from a step, stopping the current reading first.
+
+        Args:
+            message (Message): The navigation request.
+            idx (int): Index of the step, starting at 0.
+            single (bool): Read only that step. Defaults to True.
+        """
+        sess = SessionManager.get(message)
+        entry = self._interrupt_reading(message)
+        if entry is None:
+            self.speak_dialog("howto.nothing_to_read")
+            return
+        how_to = entry["how_to"]
+        if idx < 0 or how_to.steps.get(idx) is None:
+            total = how_to.n_steps or len(how_to.steps)
+            if idx >= total:
+                self.speak_dialog("howto.end")
+            else:
+                self.speak_dialog("step.invalid", {"total": total})
+            return
+        self.read_steps(sess, idx, single)
+
+    # metrics
+    def _emit_span(self, span: Dict[str, Any]) -> None:
+        self.bus.emit(Message("ovos.wikihow.span", span))
+
+    def handle_metrics_request(self, message: Message) -> None:
+        """
+        Reply to ``ovos.wikihow.metrics`` with the current metrics,
+        as a dict and in the Prometheus text format.
+        """
+        self.bus.emit(message.response({"enabled": self.metrics.enabled,
+                                        "metrics": self.metrics.snapshot(),
+                                        "prometheus": self.metrics.to_prometheus()}))
 
     # intents
     @intent_handler('wikihow.intent',
@@ -197,19 +848,77 @@ class WikiHowSkill(OVOSSkill):
             message: The message object containing the user's query.
         """
         query = message.data["query"]
-        how_to = self.get_how_to(query)
+        self._interrupt_reading(message)  # a new question, the previous guide stops here
+        how_to = self.get_how_to(query, num=self.candidates, stream=True)
         if not how_to:
             self.speak_dialog("howto.failure")
             self.remove_context("WikiHow")
         else:
             sess = SessionManager.get(message)
+            self.session_results[sess.session_id] = {"phrase": query,
+                                                     "stop_signaled": False,
+                                                     "how_to": how_to}
             self.speak_how_to(how_to, sess)
 
+    @intent_handler(IntentBuilder("WikiHowNextStep").require("NextStep").require("WikiHow"))
+    def handle_next_step(self, message: Message) -> None:
+        """ read the step after the current one """
+        entry = self._interrupt_reading(message) or {}
+        self._goto_step(message, entry.get("position", -1) + 1)
+
+    @intent_handler(IntentBuilder("WikiHowRepeatStep").require("RepeatStep").require("WikiHow"))
+    def handle_repeat_step(self, message: Message) -> None:
+        """ read the current step again """
+        entry = self._interrupt_reading(message) or {}
+        self._goto_step(message, entry.get("position", 0))
+
+    @intent_handler(IntentBuilder("WikiHowGoToStep").require("GoToStep").require("WikiHow"))
+    def handle_goto_step(self, message: Message) -> None:
+        """ read step N """
+        from ovos_number_parser import extract_number
+
+        number = extract_number(message.data.get("utterance", ""), lang=self.lang, ordinals=True)  # "the third step"
+        total = self._total_steps(message)
+        if not number or number < 1 or (total and number > total):
+            self.speak_dialog("step.invalid", {"total": total})
+            return
+        self._goto_step(message, int(number) - 1)
+
+    @intent_handler(IntentBuilder("WikiHowContinue").require("ContinueReading").require("WikiHow"))
+    def handle_continue(self, message: Message) -> None:
+        """ resume reading where it stopped, until the end of the guide """
+        entry = self._interrupt_reading(message) or {}
+        position = entry.get("position", 0)
+        self._goto_step(message, position + 1 if entry.get("finished") else position, single=False)
+
+    def _total_steps(self, message: Message) -> int:
+        entry = self.session_results.get(SessionManager.get(message).session_id) or {}
+        how_to = entry.get("how_to")
+        if not isinstance(how_to, Article):
+            return 0
+        return how_to.n_steps or len(how_to.steps)
+
     def cq_callback(self, utterance: str, answer: str, lang: str):
         """ If selected show gui """
         sess = SessionManager.get()
-        how_to = self.session_results[sess.session_id]["how_to"]
-        self.speak_how_to(how_to)
+        entry = self.session_results.get(sess.session_id)
+        pending = entry.pop("pending", None) if entry is not None else None
+        if pending is None:
+            LOG.warning(f"WikiHow session expired before being read: {sess.session_id}")
+            self.speak_dialog("howto.failure")
+            return
+        how_to = pending["how_to"]
+        if isinstance(how_to, Future):
+            try:
+                how_to = how_to.result(timeout=self.FETCH_TIMEOUT_SECONDS)
+            except Exception as e:
+                LOG.error(f"Failed to retrieve WikiHow article: {e}")
+                how_to = None
+            if not how_to:
+                self.speak_dialog("howto.failure")  # the guide read before, if any, is kept
+                return
+        entry.update(phrase=pending["phrase"], lang=pending["lang"])
+        self.speak_how_to(how_to, sess)
 
     @common_query(callback=cq_callback)
     def match_common_query(self, phrase: str, lang: str) -> Tuple[str, float]:
@@ -229,29 +938,41 @@ class WikiHowSkill(OVOSSkill):
         kw = self.extract_keyword(phrase, lang)
         if not kw:  # not a "how to" question
             return None
-        LOG.debug("WikiHow query: " + phrase)
-        how_to = self.get_how_to(phrase)
+        LOG.debug("WikiHow query: " + kw)
+        # search with the keyword, so every phrasing of a question shares one cache entry
+        deadline = self.settings.get("cq_deadline", 0)
+        if deadline:
+            response, how_to = self.get_how_to_within(kw, lang, deadline)
+        else:
+            how_to = self.get_how_to(kw, num=self.cq_candidates, lang=lang, stream=True)
+            response = how_to.intro if how_to else None
         if not how_to:
             return None
+        if isinstance(how_to, Article):
+            score = score_article(how_to, kw, lang)
+        else:  # still downloading, the answer is the title of the search result
+            score = title_score(response, kw, lang)
 
         sess = SessionManager.get()
-        self.session_results[sess.session_id] = {"phrase": phrase,
-                                                 "image": None,
-                                                 "lang": lang,
-                                                 "stop_signaled": False,
-                                                 "system_unit": sess.system_unit,
-                                                 "spoken_answer": None}
-        response = how_to["intro"]
-        self.session_results[sess.session_id]["how_to"] = how_to
-        return response, 0.7
+        # another skill may win the round, the guide being read and its position are only
+        # replaced in cq_callback, once this answer is selected
+        pending = {"phrase": phrase, "lang": lang, "how_to": how_to}
+        entry = self.session_results.get(sess.session_id)
+        if entry is None:
+            self.session_results[sess.session_id] = {"pending": pending}
+        else:
+            entry["pending"] = pending
+        return response, confidence(score)
 
     def can_stop(self, message: Message) -> bool:
         sess = SessionManager.get(message)
-        return sess.session_id in self.session_results
+        entry = self.session_results.get(sess.session_id)
+        return entry is not None and entry.get("reading", False)
 
     def stop_session(self, session: Session) -> bool:
         """
-        Stop the current WikiHow session by signaling that the user has requested to stop.
+        Stop reading the current WikiHow guide by signaling that the user has requested to stop.
+        The guide and the reading position are kept, so it can be continued later.
 
         Args:
             session (Session): The session to stop.
@@ -259,13 +980,25 @@ class WikiHowSkill(OVOSSkill):
         Returns:
             bool: True if the session was successfully stopped, False otherwise.
         """
-        if session.session_id in self.session_results:
-            self.session_results[session.session_id]["stop_signaled"] = True
+        entry = self.session_results.get(session.session_id)
+        if entry is not None and entry.get("reading", False):
+            entry["stop_signaled"] = True
+            self.metrics.incr("stop_signals")
             if session.session_id == "default":
                 self.gui.release()
             return True
         return False
 
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.tx_executor.shutdown(wait=False, cancel_futures=True)
+        self.fetch_executor.shutdown(wait=False, cancel_futures=True)
+        if self.images is not None:
+            self.images.shutdown()
+        if self.prefetcher is not None:
+            self.prefetcher.shutdown()
+        self.metrics.close()
+        super().shutdown()
 
 
 class WikiHowSolver(QuestionSolver):
@@ -275,10 +1008,80 @@ class WikiHowSolver(QuestionSolver):
         super().__init__(config, enable_tx=False, priority=60,
                          translator=translator, detector=detector)
         self.verbose = self.config.get("verbose", True)
+        configure_http(self.config)
+        self.offline: Optional[OfflineWikiHow] = load_offline_index(self.config)
+        self.cache: ArticleCache = load_article_cache(self.config)
+        self.max_concurrency: int = self.config.get("max_concurrency", 8)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                           thread_name_prefix="wikihow-solver")
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self.metrics: Metrics = load_metrics(self.config)
+        self.kw_matchers: Dict[str, Optional[KeywordExtractor]] = {}
+        self.parser_pool: Optional[ParserPool] = None
+        if self.config.get("process_pool", False):
+            self.parser_pool = ParserPool(
+                max_workers=self.config.get("process_workers", ParserPool.DEFAULT_MAX_WORKERS),
+                timeout=self.config.get("process_timeout", ParserPool.DEFAULT_TIMEOUT),
+                http=http_config(self.config))
+            self.metrics.add_collector("parser_pool", self.parser_pool.metrics)
+
+    def extract_keyword(self, query: str, lang: str) -> Optional[str]:
+        """
+        Strip the question template from a query, eg. "how do I boil an egg" -> "boil an egg".
+
+        Args:
+            query (str): The query string.
+            lang (str): The language of the query.
+
+        Returns:
+            Optional[str]: The extracted keyword, None if the query does not match any template.
+        """
+        lang = lang.split("-")[0].lower()
+        if lang not in self.kw_matchers:
+            filename = find_locale_file(lang, "howto.intent")
+            self.kw_matchers[lang] = KeywordExtractor.from_file(filename) if filename else None
+        matcher = self.kw_matchers[lang]
+        return matcher.extract(query) if matcher is not None else None
+
+    def search_how_to(self, query: str,
+                      lang: Optional[str] = "en",
+                      max_results: int = -1) -> List[SearchResult]:
+        """
+        Search WikiHow for how-to guides without downloading any article.
+
+        Args:
+            query (str): The query string.
+            lang (Optional[str]): The language of the query. Defaults to "en".
+            max_results (int): Maximum number of results, -1 for all. Defaults to -1.
+
+        Returns:
+            List[SearchResult]: Titles and urls of the matching articles.
+        """
+        with self.metrics.span("search", lang=lang):
+            if self.parser_pool is not None:
+                return [SearchResult(**r) for r in self.parser_pool.search(query, lang or "en", max_results)]
+            return search_results(query, lang or "en", max_results)
+
+    def get_articles(self, query: str,
+                     lang: Optional[str] = "en",
+                     max_results: int = -1) -> List[LazyHowTo]:
+        """
+        Search WikiHow for how-to guides, the articles are only downloaded when accessed.
+
+        Args:
+            query (str): The query string.
+            lang (Optional[str]): The language of the query. Defaults to "en".
+            max_results (int): Maximum number of results, -1 for all. Defaults to -1.
+
+        Returns:
+            List[LazyHowTo]: Lazily loaded articles.
+        """
+        fetch = self.parser_pool.fetch if self.parser_pool is not None else fetch_article
+        return [LazyHowTo(r, fetch) for r in self.search_how_to(query, lang, max_results)]
 
     def get_data(self, query: str,
                  lang: Optional[str] = "en",
-                 units: Optional[str] = None) -> Dict[str, str]:
+                 units: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Retrieves WordNet data for the given query.
 
@@ -288,10 +1091,51 @@ class WikiHowSolver(QuestionSolver):
             units (Optional[str]): Optional units for the query. Defaults to None.
 
         Returns:
-            Dict[str, str]: A dictionary containing WordNet data such as lemmas, antonyms, definitions, etc.
+            Optional[Dict[str, Any]]: The article in ``HowTo.as_dict()`` format, with the spoken form
+                of the steps and the related search results, or None if no result found.
+        """
+        how = self._get_article(query, lang)
+        return how.as_dict() if how is not None else None
+
+    def _get_article(self, query: str, lang: Optional[str] = "en") -> Optional[Article]:
+        lang = lang or "en"
+        query = self.extract_keyword(query, lang) or query
+        return get_article(self.cache, query, lang, self._fetch,
+                           offline=self.offline, offline_only=self.config.get("offline_only", False),
+                           metrics=self.metrics)
+
+    def _fetch(self, query: str, lang: str) -> Optional[Article]:
+        from pywikihow.exceptions import ParseError
+
+        for how in self.get_articles(query, lang):
+            try:
+                with self.metrics.span("fetch", url=how.url):
+                    data = Article.from_dict(how.as_dict())
+            except (ParseError, FutureTimeoutError):
+                self.metrics.incr("fetch_failures")
+                continue
+            self.cache.put(query, lang, data)
+            return data
+        return None
+
+    def _spoken_answer(self, how: Optional[Article]) -> Optional[str]:
+        """
+        Format an article as a spoken answer.
+
+        Args:
+            how (Optional[Article]): The WikiHow article.
+
+        Returns:
+            Optional[str]: The spoken answer, None if there is no article.
         """
-        for how in WikiHow.search(query, max_results=1, lang=lang):
-            return how.as_dict()
+        if not how:
+            return None
+        lines = [normalize_text(how.title), normalize_text(how.intro or "")]
+        for s in how.steps:
+            lines.append(f"{s.number} - " + " ".join(s.spoken_summary))
+            if self.verbose:
+                lines.append(" ".join(s.spoken_description))
+        return "\n".join(lines).strip()
 
     def get_spoken_answer(self, query: str,
                           lang: Optional[str] = None,
@@ -307,13 +1151,101 @@ class WikiHowSolver(QuestionSolver):
         Returns:
             str: The spoken answer as a text response.
         """
-        for how in WikiHow.search(query, max_results=1, lang=lang):
-            ans = f"{how.title}\n{how.intro}"
-            for s in how.steps:
-                ans += f"\n{s.number} - {s.summary}"
-                if self.verbose:
-                    ans += f"\n{s.description}"
-            return _normalize_text(ans)
+        return self._spoken_answer(self._get_article(query, lang))
+
+    # async api
+    async def get_data_async(self, query: str,
+                             lang: Optional[str] = "en",
+                             units: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Asyncio counterpart of get_data, the blocking fetch runs in the solver thread pool.
+        Concurrent calls for the same query and language share a single fetch.
+
+        Args:
+            query (str): The query string.
+            lang (Optional[str]): The language of the query. Defaults to "en".
+            units (Optional[str]): Optional units for the query. Defaults to None.
+
+        Returns:
+            Optional[Dict[str, Any]]: The article in ``HowTo.as_dict()`` format, or None if no result found.
+        """
+        how = await self._get_article_async(query, lang)
+        return how.as_dict() if how is not None else None
+
+    async def _get_article_async(self, query: str, lang: Optional[str] = "en") -> Optional[Article]:
+        lang = lang or "en"
+        loop = asyncio.get_running_loop()
+        key = cache_key(self.extract_keyword(query, lang) or query, lang)
+        fetch = self._inflight.get(key)
+        if fetch is None or fetch.get_loop() is not loop:
+            fetch = loop.run_in_executor(self.executor, self._get_article, query, lang)
+            self._inflight[key] = fetch
+            fetch.add_done_callback(lambda f: self._inflight.pop(key, None)
+                                    if self._inflight.get(key) is f else None)
+        # shield so a cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(fetch)
+
+    async def get_spoken_answer_async(self, query: str,
+                                      lang: Optional[str] = None,
+                                      units: Optional[str] = None) -> Optional[str]:
+        """
+        Asyncio counterpart of get_spoken_answer.
+
+        Args:
+            query (str): The query text.
+            lang (Optional[str]): Optional language code. Defaults to None.
+            units (Optional[str]): Optional units for the query. Defaults to None.
+
+        Returns:
+            Optional[str]: The spoken answer as a text response.
+        """
+        return self._spoken_answer(await self._get_article_async(query, lang))
+
+    async def get_spoken_answers_async(self, queries: List[Tuple[str, Optional[str]]],
+                                       max_concurrency: Optional[int] = None) -> List[Optional[str]]:
+        """
+        Solve a batch of queries concurrently.
+
+        Args:
+            queries (List[Tuple[str, Optional[str]]]): (query, lang) pairs.
+            max_concurrency (Optional[int]): Maximum queries solved at the same time,
+                defaults to the max_concurrency config value.
+
+        Returns:
+            List[Optional[str]]: The spoken answers, in the same order as queries.
+                None for queries without results or that failed.
+        """
+        limit = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def solve(query: str, lang: Optional[str]) -> Optional[str]:
+            async with limit:
+                try:
+                    return await self.get_spoken_answer_async(query, lang)
+                except Exception as e:
+                    LOG.error(f"WikiHow query failed: {query} - {e}")
+                    return None
+
+        return list(await asyncio.gather(*(solve(q, l) for q, l in queries)))
+
+    def get_spoken_answers(self, queries: List[Tuple[str, Optional[str]]],
+                           max_concurrency: Optional[int] = None) -> List[Optional[str]]:
+        """
+        Blocking wrapper of get_spoken_answers_async, must not be called from a running event loop.
+
+        Args:
+            queries (List[Tuple[str, Optional[str]]]): (query, lang) pairs.
+            max_concurrency (Optional[int]): Maximum queries solved at the same time.
+
+        Returns:
+            List[Optional[str]]: The spoken answers, in the same order as queries.
+        """
+        return asyncio.run(self.get_spoken_answers_async(queries, max_concurrency))
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.parser_pool is not None:
+            self.parser_pool.shutdown()
+        self.metrics.close()
 
 
 WIKIHOW_PERSONA = {
@@ -0,0 +1,211 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .search import SearchResult
+from .spoken import split_sentences
+
+
+class Step(Mapping):
+    """
+    Immutable step of a WikiHow article, with the spoken form of its text.
+
+    Supports read-only dict access with the keys of ``HowToStep.as_dict()``
+    plus ``spoken_summary`` and ``spoken_description``.
+    """
+    __slots__ = ("number", "summary", "description", "picture", "spoken_summary", "spoken_description")
+
+    def __init__(self, number: int, summary: Optional[str], description: Optional[str] = None,
+                 picture: Optional[str] = None,
+                 spoken_summary: Optional[Iterable[str]] = None,
+                 spoken_description: Optional[Iterable[str]] = None) -> None:
+        """
+        Args:
+            number (int): Number of the step, starting at 1.
+            summary (Optional[str]): The step text, None once only the spoken form is kept.
+            description (Optional[str]): The detailed step text.
+            picture (Optional[str]): Url of the step picture.
+            spoken_summary (Optional[Iterable[str]]): Sentences to speak for the summary, split from it if None.
+            spoken_description (Optional[Iterable[str]]): Sentences to speak for the description, split from it if None.
+        """
+        if spoken_summary is None:
+            spoken_summary = split_sentences(summary)
+        if spoken_description is None:
+            spoken_description = split_sentences(description)
+        for name, value in (("number", number), ("summary", summary), ("description", description),
+                            ("picture", picture), ("spoken_summary", tuple(spoken_summary)),
+                            ("spoken_description", tuple(spoken_description))):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Tuple:
+        return type(self), tuple(getattr(self, k) for k in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"Step({self.number}, {self.summary!r})"
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Step":
+        """
+        Args:
+            data (Mapping): The step in ``HowToStep.as_dict()`` format, with or without its spoken form.
+
+        Returns:
+            Step: The step, data itself if it is a Step already.
+        """
+        if isinstance(data, Step):
+            return data
+        return cls(data.get("number"), data.get("summary"), data.get("description"), data.get("picture"),
+                   data.get("spoken_summary"), data.get("spoken_description"))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: The step in ``HowToStep.as_dict()`` format, with its spoken form.
+        """
+        return {"number": self.number,
+                "summary": self.summary,
+                "description": self.description,
+                "picture": self.picture,
+                "spoken_summary": list(self.spoken_summary),
+                "spoken_description": list(self.spoken_description)}
+
+    def replace(self, **changes) -> "Step":
+        """
+        Args:
+            **changes: New values of some fields, the spoken form of changed text is split again.
+
+        Returns:
+            Step: A copy of the step with the changes.
+        """
+        fields = {k: getattr(self, k) for k in self.__slots__}
+        if "summary" in changes:
+            fields["spoken_summary"] = None
+        if "description" in changes:
+            fields["spoken_description"] = None
+        fields.update(changes)
+        return type(self)(**fields)
+
+    def sentences(self, detailed: bool = True) -> List[str]:
+        """
+        Args:
+            detailed (bool): Include the description, not only the summary. Defaults to True.
+
+        Returns:
+            List[str]: The sentences to speak for the step.
+        """
+        if detailed:
+            return list(self.spoken_summary + self.spoken_description)
+        return list(self.spoken_summary)
+
+
+class Article(Mapping):
+    """
+    Immutable WikiHow article.
+
+    Supports read-only dict access with the keys of ``HowTo.as_dict()`` plus ``related``,
+    the next search results of the question it answered. Translations are copies made
+    with ``replace``, the original text is never changed.
+
+    Steps are a tuple of Step, or a ``ReadingSteps`` producing them while they are translated.
+    """
+    __slots__ = ("title", "url", "intro", "n_steps", "steps", "related")
+
+    def __init__(self, title: str, url: Optional[str] = None, intro: Optional[str] = None,
+                 steps: Sequence[Step] = (), related: Iterable[SearchResult] = (),
+                 n_steps: Optional[int] = None) -> None:
+        """
+        Args:
+            title (str): Title of the article.
+            url (Optional[str]): Url of the article.
+            intro (Optional[str]): Introduction of the article.
+            steps (Sequence[Step]): The steps, a tuple or a ReadingSteps.
+            related (Iterable[SearchResult]): Next search results of the question the article answered.
+            n_steps (Optional[int]): Number of steps, counted from steps if None.
+        """
+        if isinstance(steps, list):
+            steps = tuple(steps)
+        if n_steps is None:
+            n_steps = len(steps)
+        for name, value in (("title", title), ("url", url), ("intro", intro), ("n_steps", n_steps),
+                            ("steps", steps), ("related", tuple(related))):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Tuple:
+        return type(self), (self.title, self.url, self.intro, tuple(self.steps), self.related, self.n_steps)
+
+    def __repr__(self) -> str:
+        return f"Article({self.title!r}, {self.url!r}, n_steps={self.n_steps})"
+
+    def __getitem__(self, key: str) -> Any:
+        if not isinstance(key, str) or key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Article":
+        """
+        Args:
+            data (Mapping): The article in ``HowTo.as_dict()`` format, eg. loaded from the cache.
+
+        Returns:
+            Article: The article, data itself if it is an Article already.
+        """
+        if isinstance(data, Article):
+            return data
+        return cls(data["title"], data.get("url"), data.get("intro"),
+                   tuple(Step.from_dict(s) for s in data.get("steps") or ()),
+                   (SearchResult(**r) for r in data.get("related") or ()),
+                   data.get("n_steps"))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: The article in ``HowTo.as_dict()`` format, with the spoken form of the steps
+                and the related search results. Steps still being produced are produced first.
+        """
+        return {"title": self.title,
+                "url": self.url,
+                "intro": self.intro,
+                "n_steps": self.n_steps,
+                "steps": [s.as_dict() for s in self.steps],
+                "related": [r.as_dict() for r in self.related]}
+
+    def replace(self, **changes) -> "Article":
+        """
+        Args:
+            **changes: New values of some fields.
+
+        Returns:
+            Article: A copy of the article with the changes.
+        """
+        fields = {k: getattr(self, k) for k in self.__slots__}
+        fields.update(changes)
+        return type(self)(**fields)
@@ -0,0 +1,381 @@
+import json
+import os
+import sqlite3
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ovos_config.locations import get_xdg_cache_save_path
+from ovos_utils.log import LOG
+
+from .article import Article
+from .keywords import canonicalize, stemmer_id
+from .metrics import Metrics
+from .offline import OfflineWikiHow
+
+
+def cache_key(query: str, lang: str) -> Tuple[str, str, str]:
+    """
+    Build the (canonical query, lang, stemmer) key used by the article cache,
+    equivalent phrasings of a question get the same key. The stemmer is part of the key,
+    so installs with and without snowballstemmer never read each other's canonical forms.
+
+    Args:
+        query (str): The raw query string, or the keyword extracted from it.
+        lang (str): The language the article was searched in.
+
+    Returns:
+        Tuple[str, str, str]: The cache key.
+    """
+    lang = lang.split("-")[0].lower()
+    return canonicalize(query, lang), lang, stemmer_id(lang)
+
+
+def _loosest(limit: int, other: int) -> int:
+    """ the larger of two limits, 0 or less meaning no limit """
+    return 0 if limit <= 0 or other <= 0 else max(limit, other)
+
+
+class ArticleCache:
+    """
+    Persistent cache of WikiHow articles, storing the ``as_dict()`` payload
+    keyed by (canonical query, lang, stemmer).
+
+    Entries expire after ``ttl`` seconds and the least recently used ones are
+    evicted once ``max_entries`` is exceeded. Payloads are kept as compressed
+    json in a sqlite file, so the skill and the solver plugin share the same
+    cache and it survives restarts. Get it with ``shared`` so they also share
+    one instance and one limit, instead of evicting each other's entries.
+    """
+    DEFAULT_TTL: int = 7 * 24 * 60 * 60  # 1 week
+    DEFAULT_MAX_ENTRIES: int = 500
+    SCHEMA_VERSION: int = 2  # older files are keyed by canonical forms that may be wrong, they are dropped
+    _shared: Dict[str, "ArticleCache"] = {}
+    _shared_lock = Lock()
+
+    def __init__(self, path: Optional[str] = None,
+                 ttl: int = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Args:
+            path (Optional[str]): Path of the sqlite file, defaults to the XDG cache directory.
+            ttl (int): Seconds an entry stays valid. Defaults to 1 week.
+            max_entries (int): Maximum number of cached articles. Defaults to 500.
+        """
+        path = path or self.default_path()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        with self._lock, self._db:
+            if self._db.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION:
+                self._db.execute("DROP TABLE IF EXISTS articles")
+                self._db.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self._db.execute("CREATE TABLE IF NOT EXISTS articles ("
+                             "query TEXT NOT NULL, "
+                             "lang TEXT NOT NULL, "
+                             "stemmer TEXT NOT NULL, "
+                             "created REAL NOT NULL, "
+                             "accessed REAL NOT NULL, "
+                             "data BLOB NOT NULL, "
+                             "PRIMARY KEY (query, lang, stemmer))")
+            self._db.execute("CREATE INDEX IF NOT EXISTS articles_accessed "
+                             "ON articles (accessed)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    @staticmethod
+    def default_path() -> str:
+        """
+        Returns:
+            str: Path of the sqlite file in the XDG cache directory.
+        """
+        return os.path.join(get_xdg_cache_save_path(), "wikihow", "articles.db")
+
+    @classmethod
+    def shared(cls, path: Optional[str] = None,
+               ttl: int = DEFAULT_TTL,
+               max_entries: int = DEFAULT_MAX_ENTRIES) -> "ArticleCache":
+        """
+        Get the cache of a sqlite file, opening it once per process. Every owner of the
+        cache, eg. the skill and the solver, gets the same instance, which keeps the
+        longest ttl and the largest max_entries asked for, 0 meaning no limit.
+
+        Args:
+            path (Optional[str]): Path of the sqlite file, defaults to the XDG cache directory.
+            ttl (int): Seconds an entry stays valid. Defaults to 1 week.
+            max_entries (int): Maximum number of cached articles. Defaults to 500.
+
+        Returns:
+            ArticleCache: The cache shared by every owner of path.
+        """
+        path = path or cls.default_path()
+        if path == ":memory:":
+            return cls(path, ttl, max_entries)
+        key = os.path.realpath(path)
+        with cls._shared_lock:
+            cache = cls._shared.get(key)
+            if cache is None:
+                cache = cls._shared[key] = cls(path, ttl, max_entries)
+            else:
+                cache.ttl = _loosest(cache.ttl, ttl)
+                cache.max_entries = _loosest(cache.max_entries, max_entries)
+            return cache
+
+    def has(self, query: str, lang: str) -> bool:
+        """
+        Check for a valid cached article without loading it or refreshing its access time.
+
+        Args:
+            query (str): The query the article was searched with.
+            lang (str): The language the article was searched in.
+
+        Returns:
+            bool: True if the article is cached and not expired.
+        """
+        try:
+            with self._lock:
+                row = self._db.execute("SELECT created FROM articles "
+                                       "WHERE query=? AND lang=? AND stemmer=?",
+                                       cache_key(query, lang)).fetchone()
+        except Exception as e:
+            LOG.error(f"Failed to read WikiHow cache: {e}")
+            return False
+        return row is not None and not (self.ttl and time.time() - row[0] > self.ttl)
+
+    def get(self, query: str, lang: str) -> Optional[Article]:
+        """
+        Retrieve a cached article.
+
+        Args:
+            query (str): The query the article was searched with.
+            lang (str): The language the article was searched in.
+
+        Returns:
+            Optional[Article]: The cached article, or None if missing or expired.
+        """
+        key = cache_key(query, lang)
+        now = time.time()
+        try:
+            with self._lock, self._db:
+                row = self._db.execute("SELECT created, data FROM articles "
+                                       "WHERE query=? AND lang=? AND stemmer=?", key).fetchone()
+                if row is None:
+                    return None
+                created, data = row
+                if self.ttl and now - created > self.ttl:
+                    self._db.execute("DELETE FROM articles WHERE query=? AND lang=? AND stemmer=?", key)
+                    return None
+                self._db.execute("UPDATE articles SET accessed=? "
+                                 "WHERE query=? AND lang=? AND stemmer=?", (now, *key))
+            return Article.from_dict(json.loads(zlib.decompress(data)))
+        except Exception as e:
+            LOG.error(f"Failed to read WikiHow cache: {e}")
+            return None
+
+    def put(self, query: str, lang: str, data: Article) -> None:
+        """
+        Store an article, evicting the least recently used entries if the cache is full.
+
+        Args:
+            query (str): The query the article was searched with.
+            lang (str): The language the article was searched in.
+            data (Article): The article, stored in ``Article.as_dict()`` format.
+        """
+        key = cache_key(query, lang)
+        now = time.time()
+        blob = zlib.compress(json.dumps(data.as_dict(), separators=(",", ":")).encode("utf-8"))
+        try:
+            with self._lock, self._db:
+                self._db.execute("INSERT OR REPLACE INTO articles "
+                                 "(query, lang, stemmer, created, accessed, data) "
+                                 "VALUES (?, ?, ?, ?, ?, ?)", (*key, now, now, blob))
+                if self.ttl:
+                    self._db.execute("DELETE FROM articles WHERE created < ?",
+                                     (now - self.ttl,))
+                if self.max_entries > 0:
+                    self._db.execute("DELETE FROM articles WHERE rowid NOT IN "
+                                     "(SELECT rowid FROM articles "
+                                     "ORDER BY accessed DESC LIMIT ?)",
+                                     (self.max_entries,))
+        except Exception as e:
+            LOG.error(f"Failed to write WikiHow cache: {e}")
+
+    def clear(self) -> None:
+        """
+        Remove every cached article.
+        """
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM articles")
+
+
+class TranslationCache:
+    """
+    In-memory LRU memo of machine translations keyed by (text, target lang),
+    so boilerplate steps and re-asked articles are only translated once.
+    """
+    DEFAULT_MAX_ENTRIES: int = 5000
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Args:
+            max_entries (int): Maximum number of memoized translations. Defaults to 5000.
+        """
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, text: str, lang: str) -> Optional[str]:
+        """
+        Args:
+            text (str): The source text.
+            lang (str): The target language.
+
+        Returns:
+            Optional[str]: The memoized translation, or None if not translated yet.
+        """
+        key = (text, lang.lower())
+        with self._lock:
+            translated = self._entries.get(key)
+            if translated is not None:
+                self._entries.move_to_end(key)
+            return translated
+
+    def put(self, text: str, lang: str, translated: str) -> None:
+        """
+        Args:
+            text (str): The source text.
+            lang (str): The target language.
+            translated (str): The translation of text.
+        """
+        key = (text, lang.lower())
+        with self._lock:
+            self._entries[key] = translated
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key, so only the first caller runs the
+    function and every other caller waits for its result.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self.fetches = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run func, unless a call for the same key is already in progress.
+
+        Args:
+            key (Hashable): Identifies equivalent calls.
+            func (Callable): The function to run.
+
+        Returns:
+            Any: The result of func, shared by every caller that waited on the call,
+                eg. an immutable Article.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = Future()
+                self.fetches += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            return call.result()
+
+        try:
+            result = func(*args, **kwargs)
+            call.set_result(result)
+            return result
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: Number of calls that ran, calls saved by waiting on another one, and calls in progress.
+        """
+        with self._lock:
+            return {"fetches": self.fetches,
+                    "coalesced": self.coalesced,
+                    "in_progress": len(self._calls)}
+
+
+# shared by the skill and the solver when loaded in the same process
+article_fetches = SingleFlight()
+
+
+def get_article(cache: ArticleCache, query: str, lang: str, fetch: Callable[..., Optional[Article]],
+                *args, offline: Optional[OfflineWikiHow] = None, offline_only: bool = False,
+                metrics: Optional[Metrics] = None) -> Optional[Article]:
+    """
+    Look up an article in the offline index, then in the cache, and fetch it on a miss.
+    Concurrent lookups of the same question wait on a single fetch, which checks the cache
+    again first, so a lookup that missed while another fetch was storing the article
+    does not download it a second time.
+
+    Args:
+        cache (ArticleCache): The article cache, fetch is expected to store what it downloads in it.
+        query (str): The query string, or the keyword extracted from it.
+        lang (str): The WikiHow language to search in.
+        fetch (Callable[..., Optional[Article]]): Downloads the article, called with query, lang and args.
+        *args: Extra arguments of fetch.
+        offline (Optional[OfflineWikiHow]): The offline index, if one is loaded. Defaults to None.
+        offline_only (bool): Never fetch articles missing from the offline index. Defaults to False.
+        metrics (Optional[Metrics]): Counts offline and cache hits and cache misses. Defaults to None.
+
+    Returns:
+        Optional[Article]: The article, or None if no result found.
+    """
+    if metrics is None:
+        metrics = Metrics()
+    if offline is not None:
+        data = offline.get_how_to(query, lang)
+        if data is not None:
+            metrics.incr("offline_hits")
+            return Article.from_dict(data)
+        if offline_only:
+            return None
+
+    def cached_or_fetch() -> Optional[Article]:
+        data = cache.get(query, lang)
+        if data is not None:
+            metrics.incr("cache_hits")
+            return data
+        metrics.incr("cache_misses")
+        return fetch(query, lang, *args)
+
+    data = cache.get(query, lang)
+    if data is not None:
+        metrics.incr("cache_hits")
+        return data
+    return article_fetches.do(cache_key(query, lang), cached_or_fetch)
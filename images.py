@@ -0,0 +1,147 @@
+import hashlib
+import io
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from ovos_config.locations import get_xdg_cache_save_path
+from ovos_utils.log import LOG
+
+from . import net
+
+
+class ImageCache:
+    """
+    Local cache of step pictures, downloaded in the background and resized for the display.
+
+    Pictures are stored as files named after their url, so the GUI can show them from disk.
+    The least recently shown ones are deleted once the cache grows over ``max_bytes``.
+    Resizing needs the optional Pillow package, without it pictures are stored as downloaded.
+    """
+    DEFAULT_MAX_BYTES: int = 50 * 1024 * 1024
+    DEFAULT_SIZE: Tuple[int, int] = (800, 480)
+
+    def __init__(self, path: Optional[str] = None,
+                 size: Tuple[int, int] = DEFAULT_SIZE,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_workers: int = 4) -> None:
+        """
+        Args:
+            path (Optional[str]): Directory of the cached pictures, defaults to the XDG cache directory.
+            size (Tuple[int, int]): Pictures are scaled down to fit in (width, height). Defaults to 800x480.
+            max_bytes (int): Maximum size of the cache on disk. Defaults to 50 MiB.
+            max_workers (int): Concurrent downloads. Defaults to 4.
+        """
+        self.path = path or os.path.join(get_xdg_cache_save_path(), "wikihow", "images")
+        os.makedirs(self.path, exist_ok=True)
+        self.size = tuple(size)
+        self.max_bytes = max_bytes
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wikihow-images")
+        self._lock = Lock()
+        self._pending: Dict[str, Future] = {}
+        self._used = sum(e.stat().st_size for e in os.scandir(self.path) if e.is_file())
+
+    def local_path(self, url: str) -> str:
+        """
+        Args:
+            url (str): The picture url.
+
+        Returns:
+            str: Where the picture is stored for the configured display size, whether cached or not.
+        """
+        key = hashlib.sha1(f"{url}@{self.size[0]}x{self.size[1]}".encode("utf-8")).hexdigest()
+        return os.path.join(self.path, key + os.path.splitext(url.split("?")[0])[1][:5])
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        Args:
+            url (str): The picture url.
+
+        Returns:
+            Optional[str]: Path of the cached picture, None if it is not cached.
+        """
+        path = self.local_path(url)
+        try:
+            os.utime(path)  # access time of the LRU eviction
+        except FileNotFoundError:
+            return None
+        return path
+
+    def prefetch(self, url: str) -> Future:
+        """
+        Download and resize a picture in the background, unless it is cached or already downloading.
+
+        Args:
+            url (str): The picture url.
+
+        Returns:
+            Future: Resolves to the path of the cached picture, or None if it could not be downloaded.
+        """
+        with self._lock:
+            future = self._pending.get(url)
+            if future is None:
+                future = self._pending[url] = self.executor.submit(self._fetch, url)
+                future.add_done_callback(lambda _: self._pending.pop(url, None))
+        return future
+
+    def _fetch(self, url: str) -> Optional[str]:
+        path = self.get(url)
+        if path is not None:
+            return path
+        try:
+            data = self._resize(net.get_content(url))
+        except Exception as e:
+            LOG.debug(f"Failed to download WikiHow picture {url}: {e}")
+            return None
+        path = self.local_path(url)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        with self._lock:
+            self._used += len(data)
+            if self._used > self.max_bytes:
+                self._evict()
+        return path
+
+    def _resize(self, data: bytes) -> bytes:
+        try:
+            from PIL import Image
+        except ImportError:
+            return data
+        with Image.open(io.BytesIO(data)) as img:
+            if img.width <= self.size[0] and img.height <= self.size[1]:
+                return data
+            fmt = img.format or "JPEG"
+            img.thumbnail(self.size)
+            if fmt == "JPEG" and img.mode not in ("RGB", "L"):
+                img = img.convert("RGB")
+            out = io.BytesIO()
+            img.save(out, format=fmt, quality=85, optimize=True)
+            return out.getvalue()
+
+    def _evict(self) -> None:
+        """ delete the least recently shown pictures down to 90% of max_bytes, the caller holds the lock """
+        files = sorted((e for e in os.scandir(self.path) if e.is_file() and not e.name.endswith(".tmp")),
+                       key=lambda e: e.stat().st_mtime)
+        self._used = sum(e.stat().st_size for e in files)
+        for entry in files:
+            if self._used <= self.max_bytes * 0.9:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                self._used -= size
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in os.scandir(self.path):
+                if entry.is_file():
+                    os.remove(entry.path)
+            self._used = 0
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
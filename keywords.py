@@ -0,0 +1,283 @@
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional
+
+from ovos_config.locations import get_xdg_cache_save_path
+from ovos_utils.log import LOG
+
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locale")
+_WORD = re.compile(r"\w+", re.UNICODE)
+_VOWEL = re.compile(r"[aeiouy]")
+# stems of -ing/-ed forms whose base word ends in e: one syllable ending consonant-vowel-consonant
+# (mak, us, hop), or an ending english words do not have without the e (danc, mov, scrambl, chang)
+_SHORT_STEM = re.compile(r"^[^aeiouy]*[aeiouy][^aeiouwxy]$")
+_E_ENDING = re.compile(r"(?:[^aeiouy](?:at|ut|ar|ur)|creat|[bcdfgkpstz]l|[aeiouy]z|c|v|[dlr]g|chang|rang|eng|ung"
+                       r"|[aeio]us|[^aeiouyc]us|[^aeiouys]s)$")
+
+ENGLISH_STEMMER_VERSION = 2  # bump when _english_stem changes the stem of any word
+# snowball stemmer names of the languages the skill supports
+SNOWBALL_LANGS = {"ca": "catalan", "da": "danish", "de": "german", "en": "english",
+                  "eu": "basque", "it": "italian", "pt": "portuguese"}
+
+
+def read_templates(filename: str) -> List[str]:
+    """
+    Read the templates of a .intent file, skipping comments and empty lines.
+
+    Args:
+        filename (str): Path of the .intent file.
+
+    Returns:
+        List[str]: The templates, with alternatives still unexpanded.
+    """
+    with open(filename) as f:
+        return [line for line in f.read().split("\n")
+                if line.strip() and not line.startswith("#")]
+
+
+def compile_templates(templates: List[str]) -> str:
+    """
+    Compile .intent templates into a single anchored regex with a capture group per {query} slot.
+
+    Templates are expanded and converted exactly like Padacioso does, and tried in the same
+    order (longest first), so the first alternative that matches gives the same result
+    as ``IntentContainer.calc_intent``.
+
+    Args:
+        templates (List[str]): The templates, as read from the .intent file.
+
+    Returns:
+        str: The combined regex pattern.
+    """
+    import simplematch
+    from padacioso.bracket_expansion import expand_parentheses, normalize_example
+
+    expanded = set()
+    for line in templates:
+        for sample in expand_parentheses(line):
+            expanded.update(expand_parentheses(normalize_example(sample)))
+    # longest first like padacioso, ties broken alphabetically to keep the pattern stable
+    samples = sorted(expanded, key=lambda s: (-len(s), s))
+
+    alternatives = []
+    for idx, sample in enumerate(samples):
+        rx = simplematch.Matcher(sample).regex[1:-1]  # strip ^ and $
+        alternatives.append(rx.replace("(?P<query>", f"(?P<q{idx}>"))
+    return "^(?:" + "|".join(alternatives) + ")$"
+
+
+class KeywordExtractor:
+    """
+    Extracts the {query} slot of an utterance matching any of the templates of a .intent file,
+    in a single case-insensitive regex pass.
+    """
+
+    def __init__(self, pattern: str) -> None:
+        """
+        Args:
+            pattern (str): Regex pattern built by ``compile_templates``.
+        """
+        self.pattern = pattern
+        self._regex = re.compile(pattern, re.IGNORECASE)
+
+    @classmethod
+    def from_templates(cls, templates: List[str]) -> "KeywordExtractor":
+        return cls(compile_templates(templates))
+
+    @classmethod
+    def from_file(cls, filename: str, cache_dir: Optional[str] = None) -> "KeywordExtractor":
+        """
+        Load a keyword extractor from a .intent file, reusing the pattern compiled
+        on a previous run if the file did not change.
+
+        Args:
+            filename (str): Path of the .intent file.
+            cache_dir (Optional[str]): Directory of the compiled pattern cache, defaults to the XDG cache directory.
+
+        Returns:
+            KeywordExtractor: The keyword extractor.
+        """
+        templates = read_templates(filename)
+        digest = hashlib.sha1("\n".join(templates).encode("utf-8")).hexdigest()
+        cache_dir = cache_dir or os.path.join(get_xdg_cache_save_path(), "wikihow")
+        cache_file = os.path.join(cache_dir, "keywords.json")
+
+        compiled: Dict[str, str] = {}
+        try:
+            with open(cache_file) as f:
+                compiled = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            LOG.warning(f"Ignoring invalid keyword cache {cache_file}: {e}")
+
+        if digest in compiled:
+            return cls(compiled[digest])
+
+        extractor = cls.from_templates(templates)
+        compiled[digest] = extractor.pattern
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_file, "w") as f:
+                json.dump(compiled, f)
+        except Exception as e:
+            LOG.warning(f"Failed to save keyword cache {cache_file}: {e}")
+        return extractor
+
+    def extract(self, utterance: str) -> Optional[str]:
+        """
+        Args:
+            utterance (str): The input phrase from which to extract a keyword.
+
+        Returns:
+            Optional[str]: The {query} slot of the first matching template, if any.
+        """
+        match = self._regex.match(utterance)
+        if match is None:
+            return None
+        for kw in match.groupdict().values():
+            if kw is not None:
+                return kw
+        return None
+
+
+def find_locale_file(lang: str, filename: str) -> Optional[str]:
+    """
+    Find a resource file of the skill for a language, matching on the base language
+    so "en", "en-US" and "en-us" all find ``locale/en-us``.
+
+    Args:
+        lang (str): The language code.
+        filename (str): Name of the file inside the language directory.
+
+    Returns:
+        Optional[str]: Path of the file, None if the language does not provide it.
+    """
+    base = lang.split("-")[0].lower()
+    try:
+        langs = sorted(os.listdir(LOCALE_DIR))
+    except FileNotFoundError:
+        return None
+    for candidate in langs:
+        if candidate.lower() == lang.lower() or candidate.split("-")[0].lower() == base:
+            path = os.path.join(LOCALE_DIR, candidate, filename)
+            if os.path.isfile(path):
+                return path
+    return None
+
+
+@lru_cache(maxsize=None)
+def load_stopwords(lang: str) -> FrozenSet[str]:
+    """
+    Args:
+        lang (str): The base language code, eg. "en".
+
+    Returns:
+        FrozenSet[str]: Words that do not change which article answers a question,
+            empty if the language has no stopwords.list.
+    """
+    path = find_locale_file(lang, "stopwords.list")
+    if path is None:
+        return frozenset()
+    return frozenset(w.lower() for w in read_templates(path))
+
+
+def _restore_e(stem: str) -> str:
+    """ the base word of what is left once -ing/-ed is removed, eg. stopp -> stop, mak -> make """
+    if len(stem) > 3 and stem[-1] == stem[-2] and stem[-1] not in "aeiouylsz":
+        return stem[:-1]  # stopping -> stopp -> stop
+    if _SHORT_STEM.match(stem) or _E_ENDING.search(stem):
+        return stem + "e"  # making -> mak -> make, changing -> chang -> change
+    return stem
+
+
+def _english_stem(word: str) -> str:
+    """
+    Light suffix stripping, enough to collapse plurals and -ing/-ed forms onto the base word.
+    The base word itself is never shortened, so "kite" and "kit" keep different stems.
+    """
+    if len(word) > 3:
+        if word.endswith("ies") and len(word) > 4:
+            word = word[:-3] + "y"
+        elif word.endswith(("sses", "shes", "ches", "xes")) or (word.endswith("oes") and len(word) > 6):
+            word = word[:-2]  # dresses, dishes, boxes, potatoes
+        elif word.endswith("s") and not word.endswith(("ss", "us", "is")):
+            word = word[:-1]
+    if word.endswith("ying") and len(word) == 5:
+        return word[0] + "ie"  # tying -> tie
+    if word.endswith("ied"):
+        return word[:-1] if len(word) == 4 else word[:-3] + "y"  # tied -> tie, cried -> cry
+    if word.endswith("ing") and _VOWEL.search(word[:-3]):
+        return _restore_e(word[:-3])
+    if word.endswith("ed") and not word.endswith("eed") and _VOWEL.search(word[:-2]):
+        return _restore_e(word[:-2])
+    return word
+
+
+@lru_cache(maxsize=None)
+def get_stemmer(lang: str) -> Optional[Callable[[str], str]]:
+    """
+    Args:
+        lang (str): The base language code, eg. "en".
+
+    Returns:
+        Optional[Callable[[str], str]]: A snowball stemmer if the optional snowballstemmer package is
+            installed, a light built-in stemmer for english otherwise, None if lang can not be stemmed.
+            Use ``stemmer_id`` to tell them apart.
+    """
+    if lang in SNOWBALL_LANGS:
+        try:
+            import snowballstemmer
+            return snowballstemmer.stemmer(SNOWBALL_LANGS[lang]).stemWord
+        except ImportError:
+            pass
+    if lang == "en":
+        return _english_stem
+    return None
+
+
+@lru_cache(maxsize=None)
+def stemmer_id(lang: str) -> str:
+    """
+    Args:
+        lang (str): The base language code, eg. "en".
+
+    Returns:
+        str: Identifies the stemmer ``canonicalize`` uses for lang, part of the cache keys so
+            canonical forms built by different stemmers, or versions of the built-in one, never mix.
+    """
+    stem = get_stemmer(lang)
+    if stem is None:
+        return "none"
+    if stem is _english_stem:
+        return f"builtin-{ENGLISH_STEMMER_VERSION}"
+    return "snowball"
+
+
+@lru_cache(maxsize=4096)
+def canonicalize(query: str, lang: str) -> str:
+    """
+    Reduce a how-to question to a canonical form, so different phrasings of the same
+    question share a cache entry: lowercase, drop stopwords and stem the remaining words.
+
+    Use on the output of ``KeywordExtractor.extract`` to also strip the question template,
+    eg. "how do I boil eggs" and "steps for boiling an egg" both become "boil egg".
+
+    Args:
+        query (str): The question, or the keyword extracted from it.
+        lang (str): The language of the question.
+
+    Returns:
+        str: The canonical form, the lowercased words of query if all of them are stopwords.
+    """
+    lang = lang.split("-")[0].lower()
+    words = _WORD.findall(query.lower())
+    stopwords = load_stopwords(lang)
+    kept = [w for w in words if w not in stopwords] or words
+    stem = get_stemmer(lang)
+    if stem is not None:
+        kept = [stem(w) for w in kept]
+    return " ".join(kept)
@@ -0,0 +1,222 @@
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ovos_utils.log import LOG
+
+# upper bounds in seconds of the span duration histogram
+BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _NoSpan:
+    """ shared context manager returned while metrics are disabled """
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _Span:
+    __slots__ = ("metrics", "name", "labels", "start")
+
+    def __init__(self, metrics: "Metrics", name: str, labels: Dict[str, Any]) -> None:
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+        self.start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        self.metrics.observe(self.name, time.perf_counter() - self.start,
+                             error=exc_type is not None, **self.labels)
+
+
+class Metrics:
+    """
+    Timing spans and counters, exported in the Prometheus text format.
+
+    Disabled instances hand out a shared no-op span and ignore counters, so instrumented
+    code costs one attribute check when metrics are turned off.
+    """
+
+    def __init__(self, enabled: bool = False, prefix: str = "wikihow",
+                 on_span: Optional[Callable[[Dict[str, Any]], None]] = None) -> None:
+        """
+        Args:
+            enabled (bool): Record spans and counters. Defaults to False.
+            prefix (str): Prefix of the exported metric names. Defaults to "wikihow".
+            on_span (Optional[Callable]): Called with every finished span, eg. to publish it on the bus.
+        """
+        self.enabled = enabled
+        self.prefix = prefix
+        self.on_span = on_span
+        self._lock = Lock()
+        self._counters: Dict[str, int] = {}
+        # span name: [count, sum, max, errors, bucket counts...]
+        self._spans: Dict[str, List[float]] = {}
+        self._collectors: Dict[str, Callable[[], Dict[str, float]]] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def span(self, name: str, **labels) -> Any:
+        """
+        Time a block of code::
+
+            with self.metrics.span("search", lang=lang):
+                ...
+
+        Args:
+            name (str): Name of the span, eg. "search".
+            **labels: Extra data sent along with the span to on_span.
+
+        Returns:
+            A context manager measuring the block.
+        """
+        if not self.enabled:
+            return _NO_SPAN
+        return _Span(self, name, labels)
+
+    def observe(self, name: str, seconds: float, error: bool = False, **labels) -> None:
+        """
+        Record the duration of a span measured by the caller.
+
+        Args:
+            name (str): Name of the span.
+            seconds (float): Duration of the span.
+            error (bool): The span ended with an exception. Defaults to False.
+            **labels: Extra data sent along with the span to on_span.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = self._spans[name] = [0, 0.0, 0.0, 0] + [0] * len(BUCKETS)
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+            stats[3] += error
+            idx = bisect_left(BUCKETS, seconds)
+            if idx < len(BUCKETS):
+                stats[4 + idx] += 1
+        if self.on_span is not None:
+            try:
+                self.on_span(dict(labels, span=name, duration=seconds, error=error))
+            except Exception as e:
+                LOG.debug(f"Failed to publish WikiHow span: {e}")
+
+    def incr(self, name: str, value: int = 1) -> None:
+        """
+        Args:
+            name (str): Name of the counter, eg. "cache_hits".
+            value (int): Amount to add. Defaults to 1.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def add_collector(self, name: str, collect: Callable[[], Dict[str, float]]) -> None:
+        """
+        Export values computed on demand, eg. ``SessionStore.metrics``, as gauges named ``<prefix>_<name>_<key>``.
+
+        Args:
+            name (str): Name of the group of values.
+            collect (Callable[[], Dict[str, float]]): Returns the current values.
+        """
+        self._collectors[name] = collect
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: Counters, span statistics and collected values.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            spans = {name: {"count": int(s[0]), "sum": s[1], "max": s[2], "errors": int(s[3])}
+                     for name, s in self._spans.items()}
+        gauges = {}
+        for name, collect in self._collectors.items():
+            try:
+                gauges[name] = collect()
+            except Exception as e:
+                LOG.debug(f"Failed to collect WikiHow metrics '{name}': {e}")
+        return {"counters": counters, "spans": spans, "gauges": gauges}
+
+    def to_prometheus(self) -> str:
+        """
+        Returns:
+            str: All metrics in the Prometheus text exposition format.
+        """
+        p = self.prefix
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            spans = sorted((name, list(s)) for name, s in self._spans.items())
+        for name, value in counters:
+            lines += [f"# TYPE {p}_{name}_total counter", f"{p}_{name}_total {value}"]
+        if spans:
+            lines.append(f"# TYPE {p}_span_seconds histogram")
+            for name, s in spans:
+                cumulative = 0
+                for bound, count in zip(BUCKETS, s[4:]):
+                    cumulative += count
+                    lines.append(f'{p}_span_seconds_bucket{{span="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{p}_span_seconds_bucket{{span="{name}",le="+Inf"}} {int(s[0])}')
+                lines.append(f'{p}_span_seconds_sum{{span="{name}"}} {s[1]}')
+                lines.append(f'{p}_span_seconds_count{{span="{name}"}} {int(s[0])}')
+            lines.append(f"# TYPE {p}_span_errors_total counter")
+            lines += [f'{p}_span_errors_total{{span="{name}"}} {int(s[3])}' for name, s in spans]
+        for group, values in sorted(self.snapshot()["gauges"].items()):
+            for key, value in sorted(values.items()):
+                lines += [f"# TYPE {p}_{group}_{key} gauge", f"{p}_{group}_{key} {value}"]
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> None:
+        """
+        Serve ``to_prometheus()`` at ``http://<host>:<port>/metrics`` from a daemon thread.
+
+        Args:
+            port (int): TCP port to listen on.
+            host (str): Address to listen on. Defaults to localhost only.
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                if self.path.rstrip("/") != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        try:
+            self._server = ThreadingHTTPServer((host, port), Handler)
+        except OSError as e:
+            LOG.error(f"Failed to serve WikiHow metrics on port {port}: {e}")
+            return
+        self._server.daemon_threads = True
+        Thread(target=self._server.serve_forever, daemon=True, name="wikihow-metrics").start()
+        LOG.info(f"Serving WikiHow metrics on http://{host}:{port}/metrics")
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,109 @@
+from threading import Lock, local
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:41.0) Gecko/20100101 Firefox/41.0"
+
+DEFAULT_POOL_SIZE: int = 10
+DEFAULT_CONNECT_TIMEOUT: float = 5
+DEFAULT_READ_TIMEOUT: float = 15
+DEFAULT_RETRIES: int = 2
+DEFAULT_BACKOFF: float = 0.5
+
+_lock = Lock()
+_session: Optional[requests.Session] = None
+_timeout: Tuple[float, float] = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+_downloaded = local()
+
+
+def configure(pool_size: int = DEFAULT_POOL_SIZE,
+              connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+              read_timeout: float = DEFAULT_READ_TIMEOUT,
+              retries: int = DEFAULT_RETRIES,
+              backoff_factor: float = DEFAULT_BACKOFF) -> requests.Session:
+    """
+    (Re)configure the keep-alive HTTP session shared by every WikiHow request in this process.
+
+    Args:
+        pool_size (int): Connections kept open per host, should match the number of threads fetching concurrently.
+        connect_timeout (float): Seconds to wait for a connection.
+        read_timeout (float): Seconds to wait for the server to send data.
+        retries (int): Retries of failed connections and 429/5xx responses.
+        backoff_factor (float): Exponential backoff factor between retries.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _session, _timeout
+    retry = Retry(total=retries, connect=retries, read=retries,
+                  backoff_factor=backoff_factor,
+                  status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset(["GET", "HEAD"]))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers["User-Agent"] = USER_AGENT
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+        _timeout = (connect_timeout, read_timeout)
+        return _session
+
+
+def get_session() -> requests.Session:
+    """
+    Returns:
+        requests.Session: The shared session, created with the default configuration on first use.
+    """
+    if _session is None:
+        return configure()
+    return _session
+
+
+def get_html(url: str) -> bytes:
+    """
+    Download a page through the shared session.
+
+    Args:
+        url (str): The page url.
+
+    Returns:
+        bytes: The page html.
+
+    Raises:
+        requests.RequestException: if the page could not be downloaded
+    """
+    r = get_session().get(url, timeout=_timeout)
+    _downloaded.bytes = downloaded_bytes() + len(r.content)
+    r.raise_for_status()
+    return r.text.encode("utf8")
+
+
+def get_content(url: str) -> bytes:
+    """
+    Download a binary file, eg. an image, through the shared session.
+
+    Args:
+        url (str): The file url.
+
+    Returns:
+        bytes: The file contents.
+
+    Raises:
+        requests.RequestException: if the file could not be downloaded
+    """
+    r = get_session().get(url, timeout=_timeout)
+    _downloaded.bytes = downloaded_bytes() + len(r.content)
+    r.raise_for_status()
+    return r.content
+
+
+def downloaded_bytes() -> int:
+    """
+    Returns:
+        int: Bytes downloaded by get_html in the calling thread so far.
+    """
+    return getattr(_downloaded, "bytes", 0)
@@ -0,0 +1,314 @@
+"""
+Offline WikiHow backend: a BM25 full-text index over a local dump of articles.
+
+The dump is a .jsonl file with one article per line, in the same format as ``HowTo.as_dict()``.
+Build an index with::
+
+    python offline.py build articles.jsonl /path/to/index/en
+
+and point the ``offline_index`` setting to ``/path/to/index``, with one sub directory per language.
+"""
+import json
+import math
+import mmap
+import os
+import re
+from array import array
+from collections import defaultdict
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+INDEX_VERSION = 2
+TITLE_BOOST = 3  # title terms are counted this many times
+_TOKEN = re.compile(r"\w\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Args:
+        text (str): Text to index or search.
+
+    Returns:
+        List[str]: Lowercase word tokens, single characters are dropped.
+    """
+    return _TOKEN.findall(text.lower())
+
+
+def _article_tokens(article: Dict) -> List[str]:
+    tokens = tokenize(article.get("title") or "") * TITLE_BOOST
+    tokens += tokenize(article.get("intro") or "")
+    for step in article.get("steps", []):
+        tokens += tokenize(step.get("summary") or "")
+    return tokens
+
+
+def read_corpus(path: str) -> Iterable[Dict]:
+    """
+    Args:
+        path (str): A .jsonl file with one article per line.
+
+    Yields:
+        Dict: The articles.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def build_index(articles: Iterable[Dict], index_dir: str) -> int:
+    """
+    Build an on-disk BM25 index.
+
+    Args:
+        articles (Iterable[Dict]): Articles in the same format as ``HowTo.as_dict()``.
+        index_dir (str): Directory to write the index to.
+
+    Returns:
+        int: Number of indexed articles.
+    """
+    os.makedirs(index_dir, exist_ok=True)
+    postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+    doclens = array("I")
+    offsets = array("Q", [0])
+    with open(os.path.join(index_dir, "articles.jsonl"), "wb") as f:
+        for doc_id, article in enumerate(articles):
+            line = json.dumps(article, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+            f.write(line)
+            offsets.append(offsets[-1] + len(line))
+            tokens = _article_tokens(article)
+            doclens.append(len(tokens))
+            counts: Dict[str, int] = defaultdict(int)
+            for token in tokens:
+                counts[token] += 1
+            for token, tf in counts.items():
+                postings[token].append((doc_id, tf))
+
+    # the vocabulary is a table of terms sorted by their utf-8 bytes, binary searched in place:
+    # terms.bin holds the terms back to back, term_offsets.bin where each one starts
+    # and term_postings.bin the (postings offset, document frequency) of each one
+    terms = bytearray()
+    term_offsets = array("Q", [0])
+    term_postings = array("I")
+    flat = array("I")
+    for term in sorted(postings, key=lambda t: t.encode("utf-8")):
+        terms += term.encode("utf-8")
+        term_offsets.append(len(terms))
+        term_postings.extend((len(flat) // 2, len(postings[term])))
+        for doc_id, tf in postings[term]:
+            flat.extend((doc_id, tf))
+
+    for name, data in (("postings.bin", flat), ("doclens.bin", doclens), ("offsets.bin", offsets),
+                       ("term_offsets.bin", term_offsets), ("term_postings.bin", term_postings)):
+        with open(os.path.join(index_dir, name), "wb") as f:
+            data.tofile(f)
+    with open(os.path.join(index_dir, "terms.bin"), "wb") as f:
+        f.write(terms)
+    n_docs = len(doclens)
+    with open(os.path.join(index_dir, "meta.json"), "w") as f:
+        json.dump({"version": INDEX_VERSION,
+                   "n_docs": n_docs,
+                   "avgdl": (sum(doclens) / n_docs) if n_docs else 0}, f)
+    return n_docs
+
+
+def _mmap(path: str, typecode: str) -> memoryview:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(array(typecode))
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mm).cast(typecode) if typecode != "B" else memoryview(mm)
+
+
+class OfflineIndex:
+    """
+    Memory-mapped BM25 index over a local dump of WikiHow articles for one language.
+    Only the small metadata file is read when opened, every other file, including the
+    sorted vocabulary, is memory-mapped and searched in place.
+    """
+
+    def __init__(self, index_dir: str, k1: float = 1.2, b: float = 0.75) -> None:
+        """
+        Args:
+            index_dir (str): Directory written by ``build_index``.
+            k1 (float): BM25 term frequency saturation. Defaults to 1.2.
+            b (float): BM25 length normalization. Defaults to 0.75.
+        """
+        with open(os.path.join(index_dir, "meta.json")) as f:
+            meta = json.load(f)
+        if meta.get("version") != INDEX_VERSION:
+            raise ValueError(f"unsupported WikiHow index version: {meta.get('version')}")
+        self.index_dir = index_dir
+        self.n_docs: int = meta["n_docs"]
+        self.avgdl: float = meta["avgdl"] or 1
+        self.k1 = k1
+        self.b = b
+        self._postings = _mmap(os.path.join(index_dir, "postings.bin"), "I")
+        self._doclens = _mmap(os.path.join(index_dir, "doclens.bin"), "I")
+        self._offsets = _mmap(os.path.join(index_dir, "offsets.bin"), "Q")
+        self._articles = _mmap(os.path.join(index_dir, "articles.jsonl"), "B")
+        self._terms = _mmap(os.path.join(index_dir, "terms.bin"), "B")
+        self._term_offsets = _mmap(os.path.join(index_dir, "term_offsets.bin"), "Q")
+        self._term_postings = _mmap(os.path.join(index_dir, "term_postings.bin"), "I")
+
+    def __len__(self) -> int:
+        return self.n_docs
+
+    def lookup(self, term: str) -> Optional[Tuple[int, int]]:
+        """
+        Binary search the vocabulary.
+
+        Args:
+            term (str): A token of the query.
+
+        Returns:
+            Optional[Tuple[int, int]]: Offset of the term postings and its document frequency,
+                None if no article contains the term.
+        """
+        key = term.encode("utf-8")
+        lo, hi = 0, len(self._term_offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            found = self._terms[self._term_offsets[mid]:self._term_offsets[mid + 1]].tobytes()
+            if found < key:
+                lo = mid + 1
+            elif found > key:
+                hi = mid
+            else:
+                return self._term_postings[mid * 2], self._term_postings[mid * 2 + 1]
+        return None
+
+    def get_article(self, doc_id: int) -> Dict:
+        """
+        Args:
+            doc_id (int): Position of the article in the dump.
+
+        Returns:
+            Dict: The article in the same format as ``HowTo.as_dict()``.
+        """
+        start, end = self._offsets[doc_id], self._offsets[doc_id + 1]
+        return json.loads(bytes(self._articles[start:end]))
+
+    def search(self, query: str, max_results: int = 1,
+               min_coverage: float = 0.35) -> List[Tuple[float, Dict]]:
+        """
+        Args:
+            query (str): The query string to search for.
+            max_results (int, optional): Maximum number of results. Defaults to 1.
+            min_coverage (float, optional): Minimum fraction of the query terms, weighted by idf,
+                an article must contain. Defaults to 0.35.
+
+        Returns:
+            List[Tuple[float, Dict]]: (BM25 score, article) pairs, best first.
+        """
+        terms = set(tokenize(query))
+        if not terms or not self.n_docs:
+            return []
+        scores: Dict[int, float] = defaultdict(float)
+        matched: Dict[int, float] = defaultdict(float)
+        # terms missing from the index count with the idf of a term in no document
+        total_idf = 0.0
+        for term in terms:
+            entry = self.lookup(term)
+            df = entry[1] if entry else 0
+            idf = math.log(1 + (self.n_docs - df + 0.5) / (df + 0.5))
+            total_idf += idf
+            if entry is None:
+                continue
+            offset = entry[0]
+            for i in range(offset * 2, (offset + df) * 2, 2):
+                doc_id, tf = self._postings[i], self._postings[i + 1]
+                norm = self.k1 * (1 - self.b + self.b * self._doclens[doc_id] / self.avgdl)
+                scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+                matched[doc_id] += idf
+
+        needed = min_coverage * total_idf
+        ranked = sorted((doc_id for doc_id in scores if matched[doc_id] >= needed),
+                        key=lambda d: scores[d], reverse=True)
+        return [(scores[d], self.get_article(d)) for d in ranked[:max_results]]
+
+
+class OfflineWikiHow:
+    """
+    Offline indexes for every language found in a directory, one ``build_index`` output per sub directory.
+    """
+
+    def __init__(self, path: str, min_coverage: float = 0.35) -> None:
+        """
+        Args:
+            path (str): Directory with one index per language, eg. ``<path>/en``.
+            min_coverage (float): Minimum fraction of the query terms, weighted by idf,
+                an article must contain. Defaults to 0.35.
+        """
+        self.path = path
+        self.min_coverage = min_coverage
+        self._indexes: Dict[str, Optional[OfflineIndex]] = {}
+        self._lock = Lock()
+
+    def get_index(self, lang: str) -> Optional[OfflineIndex]:
+        """
+        Args:
+            lang (str): The language of the index.
+
+        Returns:
+            Optional[OfflineIndex]: The index, opened on first use. None if there is no index for lang.
+        """
+        lang = lang.split("-")[0].lower()
+        if lang not in self._indexes:
+            with self._lock:
+                if lang not in self._indexes:
+                    index_dir = os.path.join(self.path, lang)
+                    self._indexes[lang] = OfflineIndex(index_dir) \
+                        if os.path.isfile(os.path.join(index_dir, "meta.json")) else None
+        return self._indexes[lang]
+
+    def search(self, query: str, lang: str = "en", max_results: int = 1) -> List[Tuple[float, Dict]]:
+        """
+        Args:
+            query (str): The query string to search for.
+            lang (str, optional): The language to search in. Defaults to "en".
+            max_results (int, optional): Maximum number of results. Defaults to 1.
+
+        Returns:
+            List[Tuple[float, Dict]]: (BM25 score, article) pairs, best first.
+        """
+        index = self.get_index(lang)
+        if index is None:
+            return []
+        return index.search(query, max_results, self.min_coverage)
+
+    def get_how_to(self, query: str, lang: str = "en") -> Optional[Dict]:
+        """
+        Args:
+            query (str): The query string to search for.
+            lang (str, optional): The language to search in. Defaults to "en".
+
+        Returns:
+            Optional[Dict]: The best matching article, None if nothing matches.
+        """
+        results = self.search(query, lang, 1)
+        return results[0][1] if results else None
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="offline WikiHow index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="index a .jsonl dump of articles")
+    build.add_argument("corpus")
+    build.add_argument("index_dir")
+    query = sub.add_parser("search", help="search an index")
+    query.add_argument("index_dir")
+    query.add_argument("query")
+    query.add_argument("-n", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        print(f"indexed {build_index(read_corpus(args.corpus), args.index_dir)} articles")
+    else:
+        t = time.perf_counter()
+        for score, article in OfflineIndex(args.index_dir).search(args.query, args.n):
+            print(f"{score:.2f} - {article['title']}")
+        print(f"{(time.perf_counter() - t) * 1000:.2f} ms")
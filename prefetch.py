@@ -0,0 +1,113 @@
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Deque, Dict, Iterable, List, Set, Tuple
+
+from ovos_utils.log import LOG
+
+from . import net
+
+
+class Prefetcher:
+    """
+    Downloads articles the user is likely to ask for next in the background, within a budget.
+
+    At most ``max_workers`` articles are downloaded at the same time, and a prefetch is skipped
+    once the prefetches of the last minute downloaded ``max_bytes_per_minute``.
+    """
+    DEFAULT_MAX_ARTICLES: int = 2
+    DEFAULT_MAX_WORKERS: int = 1
+    DEFAULT_MAX_BYTES_PER_MINUTE: int = 2 * 1024 * 1024
+
+    def __init__(self, fetch: Callable[[Dict], bool],
+                 max_articles: int = DEFAULT_MAX_ARTICLES,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 max_bytes_per_minute: int = DEFAULT_MAX_BYTES_PER_MINUTE) -> None:
+        """
+        Args:
+            fetch (Callable[[Dict], bool]): Downloads and caches the article of a search result
+                (``SearchResult.as_dict()``), returns False if it was already cached.
+            max_articles (int): Articles prefetched per request. Defaults to 2.
+            max_workers (int): Concurrent prefetches. Defaults to 1.
+            max_bytes_per_minute (int): Download budget of the prefetches. Defaults to 2 MiB.
+        """
+        self.fetch = fetch
+        self.max_articles = max_articles
+        self.max_bytes_per_minute = max_bytes_per_minute
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wikihow-prefetch")
+        self._lock = Lock()
+        self._pending: Set[str] = set()
+        self._downloads: Deque[Tuple[float, int]] = deque()  # (time, bytes)
+        self.prefetched = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def _spent(self) -> int:
+        """ bytes downloaded by prefetches in the last minute, the caller holds the lock """
+        now = time.monotonic()
+        while self._downloads and now - self._downloads[0][0] > 60:
+            self._downloads.popleft()
+        return sum(size for _, size in self._downloads)
+
+    def prefetch(self, results: Iterable[Dict]) -> List[Future]:
+        """
+        Queue the first results for download, skipping the ones already queued.
+
+        Args:
+            results (Iterable[Dict]): Search results in ``SearchResult.as_dict()`` format, best first.
+
+        Returns:
+            List[Future]: One future per queued result, resolving to True if it was downloaded.
+        """
+        futures = []
+        for result in list(results)[:self.max_articles]:
+            with self._lock:
+                if result["url"] in self._pending:
+                    continue
+                self._pending.add(result["url"])
+            try:
+                futures.append(self.executor.submit(self._run, result))
+            except RuntimeError:  # shut down
+                with self._lock:
+                    self._pending.discard(result["url"])
+                break
+        return futures
+
+    def _run(self, result: Dict) -> bool:
+        try:
+            with self._lock:
+                if self._spent() >= self.max_bytes_per_minute:
+                    self.skipped += 1
+                    LOG.debug(f"WikiHow prefetch budget exhausted, skipping: {result['url']}")
+                    return False
+            before = net.downloaded_bytes()
+            try:
+                fetched = self.fetch(result)
+            except Exception as e:
+                LOG.debug(f"WikiHow prefetch failed: {result['url']} - {e}")
+                fetched = False
+                with self._lock:
+                    self.failed += 1
+            with self._lock:
+                self._downloads.append((time.monotonic(), net.downloaded_bytes() - before))
+                self.prefetched += fetched
+            return fetched
+        finally:
+            with self._lock:
+                self._pending.discard(result["url"])
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: Articles prefetched, skipped over budget and failed so far,
+                and bytes downloaded by prefetches in the last minute.
+        """
+        with self._lock:
+            return {"prefetched": self.prefetched,
+                    "skipped": self.skipped,
+                    "failed": self.failed,
+                    "bytes_last_minute": self._spent()}
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,65 @@
+from typing import FrozenSet, Mapping
+
+from .keywords import canonicalize
+
+TITLE_WEIGHT: float = 0.6
+INTRO_WEIGHT: float = 0.25
+STEPS_WEIGHT: float = 0.15
+IDEAL_STEPS: int = 5  # guides with at least this many steps get the full step score
+
+
+def _terms(text: str, lang: str) -> FrozenSet[str]:
+    return frozenset(canonicalize(text, lang).split())
+
+
+def title_score(title: str, keyword: str, lang: str) -> float:
+    """
+    Args:
+        title (str): Title of an article, eg. "Boil an Egg".
+        keyword (str): The question, or the keyword extracted from it.
+        lang (str): The language of the question.
+
+    Returns:
+        float: Dice similarity of the canonical words of title and keyword, between 0 and 1.
+    """
+    query, words = _terms(keyword, lang), _terms(title, lang)
+    if not query or not words:
+        return 0.0
+    return 2 * len(query & words) / (len(query) + len(words))
+
+
+def score_article(article: Mapping, keyword: str, lang: str) -> float:
+    """
+    Score how well an article answers a question, from the similarity of its title,
+    the question words found in its intro and whether it has enough steps.
+
+    Args:
+        article (Mapping): The article, or a dict in ``HowTo.as_dict()`` format.
+        keyword (str): The question, or the keyword extracted from it.
+        lang (str): The language of the question and the article.
+
+    Returns:
+        float: The score, between 0 and 1.
+    """
+    query = _terms(keyword, lang)
+    if not query:
+        return 0.0
+    intro = len(query & _terms(article.get("intro") or "", lang)) / len(query)
+    n_steps = article.get("n_steps")
+    if not n_steps and isinstance(article.get("steps"), (list, tuple)):
+        n_steps = len(article["steps"])
+    steps = min(n_steps or 0, IDEAL_STEPS) / IDEAL_STEPS
+    return (TITLE_WEIGHT * title_score(article.get("title") or "", keyword, lang) +
+            INTRO_WEIGHT * intro +
+            STEPS_WEIGHT * steps)
+
+
+def confidence(score: float) -> float:
+    """
+    Args:
+        score (float): Score of the answer, between 0 and 1.
+
+    Returns:
+        float: Common query confidence, between 0.35 for an unrelated article and 0.95 for a perfect match.
+    """
+    return round(0.35 + 0.6 * max(0.0, min(score, 1.0)), 3)
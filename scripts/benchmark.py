@@ -0,0 +1,213 @@
+"""offline benchmark suite for the skill and the solver
+
+runs everything against the local WikiHow stub (scripts/stub_server.py) with a fake bus and a
+fake translator, and writes the results as json so they can be compared between releases
+
+usage: python scripts/benchmark.py [--output results.json] [--pages recorded/pages/dir] [--quick]
+
+    extract_keyword        keyword extraction throughput over the fixture query log
+    match_common_query     common query latency, cold (empty cache) and warm
+    get_how_to             end to end search + download + parse, cold
+    tx                     translating a whole article with a fake translator, no memo
+    speak_how_to           gap between the end of an utterance and the start of the next one
+    solver                 WikiHowSolver.get_spoken_answers throughput at several concurrency levels
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from os.path import dirname
+
+sys.path.insert(0, dirname(__file__))
+from stub_server import StubWikiHow, import_skill, point_wikihow_to  # noqa: E402
+
+QUERY_LOG = f"{dirname(__file__)}/fixtures/query_log_en.txt"
+SKILL_ID = "ovos-skill-wikihow.openvoiceos"
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return {"n": len(samples),
+            "p50_ms": samples[len(samples) // 2] * 1000,
+            "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000,
+            "mean_ms": statistics.fmean(samples) * 1000}
+
+
+class FakeTranslator:
+    """stands in for a translator plugin, costs a fixed time per request"""
+
+    def __init__(self, latency=0.002):
+        self.latency = latency
+        self.requests = 0
+
+    def translate(self, text, target=None, source=None):
+        self.requests += 1
+        time.sleep(self.latency)
+        return text[::-1]
+
+
+def bench_extract_keyword(skill, queries, rounds):
+    skill.extract_keyword(queries[0], "en-us")  # compile outside the measurement
+    t = time.perf_counter()
+    for _ in range(rounds):
+        for q in queries:
+            skill.extract_keyword(q, "en-us")
+    elapsed = time.perf_counter() - t
+    return {"queries": rounds * len(queries),
+            "per_second": rounds * len(queries) / elapsed}
+
+
+def bench_match_common_query(skill, queries, rounds):
+    # "how ..." questions are in MiscBlacklist.voc and rejected right away, time the ones answered
+    queries = [q for q in queries if not skill.voc_match(q, "MiscBlacklist")]
+    cold, warm = [], []
+    for q in queries[:rounds]:
+        skill.cache.clear()
+        t = time.perf_counter()
+        skill.match_common_query(q, "en-us")
+        cold.append(time.perf_counter() - t)
+        t = time.perf_counter()
+        skill.match_common_query(q, "en-us")
+        warm.append(time.perf_counter() - t)
+    skill.session_results.clear()
+    return {"cold": percentiles(cold), "warm": percentiles(warm)}
+
+
+def bench_get_how_to(skill, queries, rounds):
+    samples = []
+    for q in queries[:rounds]:
+        skill.cache.clear()
+        t = time.perf_counter()
+        assert skill.get_how_to(skill.extract_keyword(q, "en-us") or q, lang="en-us")
+        samples.append(time.perf_counter() - t)
+    return percentiles(samples)
+
+
+def bench_tx(skill, rounds):
+    translator = FakeTranslator()
+    skill.translator = translator
+    article = skill.get_how_to("boil an egg", lang="en-us")
+    samples = []
+    for _ in range(rounds):
+        skill.tx_cache.clear()
+        data = article.replace()  # a copy without the translation kept by the previous round
+        t = time.perf_counter()
+        skill._tx(data, "xx")
+        samples.append(time.perf_counter() - t)
+    return dict(percentiles(samples),
+                segments=translator.requests // rounds,
+                translator_latency_ms=translator.latency * 1000)
+
+
+def bench_speak_how_to(skill, rounds, playback=0.005):
+    from ovos_bus_client.session import SessionManager
+
+    utterances = []
+
+    def speak(utterance, *args, **kwargs):
+        start = time.perf_counter()
+        time.sleep(playback)  # the audio service playing the utterance
+        utterances.append((start, time.perf_counter()))
+
+    skill.speak = speak
+    skill.speak_dialog = lambda dialog, data=None, *args, **kwargs: speak(dialog)
+    sess = SessionManager.get()
+    gaps = []
+    for _ in range(rounds):
+        utterances.clear()
+        skill.cache.clear()
+        how_to = skill.get_how_to("boil an egg", lang="en-us", stream=True)
+        skill.session_results[sess.session_id] = {"phrase": "boil an egg",
+                                                  "stop_signaled": False,
+                                                  "how_to": how_to}
+        skill.speak_how_to(how_to, sess)
+        gaps += [nxt[0] - prev[1] for prev, nxt in zip(utterances, utterances[1:])]
+    return dict(percentiles(gaps), utterances=len(utterances), playback_ms=playback * 1000)
+
+
+def bench_solver(module, queries, levels):
+    results = {}
+    for level in levels:
+        solver = module.WikiHowSolver({"max_concurrency": level})
+        solver.cache.clear()
+        batch = [(q, "en") for q in queries]
+        t = time.perf_counter()
+        answers = solver.get_spoken_answers(batch, max_concurrency=level)
+        elapsed = time.perf_counter() - t
+        assert all(answers)
+        results[str(level)] = {"queries": len(batch),
+                               "seconds": elapsed,
+                               "per_second": len(batch) / elapsed}
+        solver.executor.shutdown()
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=dirname(dirname(os.path.abspath(__file__))),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--output", help="write the json results to this file instead of stdout")
+    parser.add_argument("--pages", help="directory of recorded WikiHow pages to serve")
+    parser.add_argument("--delay", type=float, default=0.005, help="stub server latency in seconds")
+    parser.add_argument("--quick", action="store_true", help="fewer rounds, for smoke testing")
+    args = parser.parse_args()
+    rounds = 3 if args.quick else 20
+
+    # logs go to stderr, only the json results are printed on stdout
+    with tempfile.TemporaryDirectory() as home, contextlib.redirect_stdout(sys.stderr):
+        # never touch the real article cache, nor read the real settings, eg. metrics_port
+        os.environ["XDG_CACHE_HOME"] = os.path.join(home, "cache")
+        os.environ["XDG_CONFIG_HOME"] = os.path.join(home, "config")
+        module = import_skill()
+        from ovos_utils.fakebus import FakeBus
+        from ovos_skill_wikihow.cache import article_fetches
+
+        server = StubWikiHow(delay=args.delay, pages_dir=args.pages).start()
+        point_wikihow_to(server.base_url)
+        with open(QUERY_LOG) as f:
+            queries = [l.strip() for l in f if l.strip()]
+
+        skill = module.WikiHowSkill(skill_id=SKILL_ID, bus=FakeBus())
+        results = {
+            "extract_keyword": bench_extract_keyword(skill, queries, rounds * 10),
+            "match_common_query": bench_match_common_query(skill, queries, rounds),
+            "get_how_to": bench_get_how_to(skill, queries, rounds),
+            "tx": bench_tx(skill, rounds),
+            "speak_how_to": bench_speak_how_to(skill, max(1, rounds // 5)),
+            "solver": bench_solver(module, queries, (1, 4, 8)),
+        }
+        skill.shutdown()
+        server.stop()
+
+    report = {"version": 1,
+              "timestamp": time.time(),
+              "revision": git_revision(),
+              "python": platform.python_version(),
+              "platform": platform.platform(),
+              "stub": {"delay_s": args.delay,
+                       "recorded_pages": bool(args.pages),
+                       "requests": server.requests,
+                       "connections": server.connections},
+              "single_flight": article_fetches.metrics(),
+              "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
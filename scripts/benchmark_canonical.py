@@ -0,0 +1,83 @@
+"""replay a sample query log through the article cache keys and report the hit rate
+
+compares keying the cache by the raw question (lowercased, whitespace collapsed) with the
+canonical key built from the extracted keyword, a question is a hit if an earlier question
+in the log had the same key
+
+then checks that questions asking for different articles do not share a canonical key and
+that inflections of the same question do, exits with an error if any pair fails
+
+usage: python scripts/benchmark_canonical.py [query_log.txt] [lang]
+"""
+import re
+import sys
+import time
+from os.path import dirname
+
+from stub_server import import_skill
+
+skill = import_skill()
+from ovos_skill_wikihow.cache import cache_key  # noqa: E402
+from ovos_skill_wikihow.keywords import KeywordExtractor, find_locale_file  # noqa: E402
+
+log = sys.argv[1] if len(sys.argv) > 1 else f"{dirname(__file__)}/fixtures/query_log_en.txt"
+lang = sys.argv[2] if len(sys.argv) > 2 else "en-us"
+with open(log) as f:
+    queries = [l.strip() for l in f if l.strip()]
+
+# questions that must never be answered by the same cached article
+DISTINCT = [
+    ("how to make her happy", "how to make me happy"),
+    ("how to get a girl to like you", "how to get a girl to like me"),
+    ("how to open a can", "how to open"),
+    ("how to be good", "how to be"),
+    ("how to do it right", "how to do it"),
+    ("how can i tie a tie", "how can i tie"),
+    ("how to find your way home", "how to find home"),
+    ("how to make a kite", "how to make a kit"),
+    ("how to clean a tube", "how to clean a tub"),
+    ("how to draw a plane", "how to draw a plan"),
+    ("how to knit a hat", "how to knit hate"),
+    ("how to write a note", "how to write not"),
+]
+# phrasings that must share the cached article
+SAME = [
+    ("how to make a kite", "steps for making kites"),
+    ("how to use chopsticks", "steps for using chopsticks"),
+    ("how to change a tire", "steps for changing tires"),
+    ("how to bake cookies", "steps for baking cookies"),
+    ("how to stop snoring", "steps for stopping snoring"),
+]
+
+matcher = KeywordExtractor.from_file(find_locale_file(lang, "howto.intent"))
+
+
+def raw_key(query):
+    return re.sub(r"\s+", " ", query.lower()).strip(" ?!.,"), lang
+
+
+def canonical_key(query):
+    return cache_key(matcher.extract(query) or query, lang)
+
+
+for name, key in (("raw", raw_key), ("canonical", canonical_key)):
+    seen = set()
+    hits = 0
+    t = time.perf_counter()
+    for query in queries:
+        k = key(query)
+        hits += k in seen
+        seen.add(k)
+    elapsed = (time.perf_counter() - t) / len(queries)
+    print(f"{name:>9}: {len(seen):3d} distinct keys, hit rate {hits / len(queries):6.1%} "
+          f"({elapsed * 1e6:.1f} us/query)")
+
+collisions = [(a, b) for a, b in DISTINCT if canonical_key(a) == canonical_key(b)]
+for a, b in collisions:
+    print(f"false collision: {a!r} and {b!r} -> {canonical_key(a)}")
+print(f"{len(DISTINCT) - len(collisions)}/{len(DISTINCT)} distinct questions keep distinct keys")
+misses = [(a, b) for a, b in SAME if canonical_key(a) != canonical_key(b)]
+for a, b in misses:
+    print(f"missed match: {a!r} -> {canonical_key(a)} and {b!r} -> {canonical_key(b)}")
+print(f"{len(SAME) - len(misses)}/{len(SAME)} inflected questions share a key")
+sys.exit(1 if collisions or misses else 0)
@@ -0,0 +1,40 @@
+"""check that WikiHow requests reuse keep-alive connections from the shared HTTP session
+
+fetches search pages and articles from a local stub server, from several threads,
+and reports how many TCP connections were opened for how many requests
+"""
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from os.path import dirname
+
+sys.path.insert(0, dirname(__file__))
+from stub_server import ARTICLES, StubWikiHow, import_skill, point_wikihow_to  # noqa: E402
+
+THREADS = 4
+ROUNDS = 25
+
+skill = import_skill()
+from ovos_skill_wikihow import net  # noqa: E402
+from ovos_skill_wikihow.search import fetch_article, search_results  # noqa: E402
+
+server = StubWikiHow().start()
+point_wikihow_to(server.base_url)
+net.configure(pool_size=THREADS)
+
+
+def lookup(i):
+    results = search_results(f"query {i}", "en", max_results=1)
+    return fetch_article(server.base_url + "/" + ARTICLES[i % len(ARTICLES)])["n_steps"] and len(results)
+
+
+t = time.perf_counter()
+with ThreadPoolExecutor(THREADS) as pool:
+    assert all(pool.map(lookup, range(ROUNDS * THREADS)))
+elapsed = time.perf_counter() - t
+server.stop()
+
+print(f"{server.requests} requests over {server.connections} connections "
+      f"({server.requests / server.connections:.1f} requests per connection) "
+      f"in {elapsed * 1000:.0f} ms with {THREADS} threads")
+sys.exit(0 if server.connections <= THREADS else 1)
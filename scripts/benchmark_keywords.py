@@ -0,0 +1,82 @@
+"""compare the compiled keyword extractor against the padacioso matcher it replaced
+
+checks that both return the same keyword for utterances generated from every locale/*/howto.intent
+and reports the time per utterance of each
+"""
+import sys
+import tempfile
+import time
+from os.path import dirname, isfile
+
+from padacioso import IntentContainer
+from padacioso.bracket_expansion import expand_parentheses
+
+sys.path.insert(0, dirname(dirname(__file__)))
+from keywords import KeywordExtractor, read_templates  # noqa: E402
+
+import os  # noqa: E402
+
+locale = f"{dirname(dirname(__file__))}/locale"
+QUERIES = ["boil an egg", "Make Pancakes", "tie a tie?"]
+NEGATIVES = ["what is the weather like", "tell me a joke", "how", ""]
+
+
+def padacioso_matcher(templates):
+    samples = []
+    for line in templates:
+        if "(" in line:
+            samples += expand_parentheses(line)
+        else:
+            samples.append(line)
+    container = IntentContainer()
+    container.add_intent("question", samples)
+    return container
+
+
+def utterances(templates):
+    for line in templates:
+        for sample in expand_parentheses(line):
+            for q in QUERIES:
+                utt = sample.replace("{query}", q)
+                yield utt
+                yield utt.upper()
+    yield from NEGATIVES
+
+
+mismatches = 0
+for lang in sorted(os.listdir(locale)):
+    filename = f"{locale}/{lang}/howto.intent"
+    if not isfile(filename):
+        continue
+    templates = read_templates(filename)
+    utts = list(utterances(templates))
+
+    t = time.perf_counter()
+    container = padacioso_matcher(templates)
+    expected = [container.calc_intent(u).get("entities", {}).get("query") for u in utts]
+    padacioso_time = time.perf_counter() - t
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        t = time.perf_counter()
+        extractor = KeywordExtractor.from_file(filename, cache_dir)
+        compile_time = time.perf_counter() - t
+        t = time.perf_counter()
+        extractor = KeywordExtractor.from_file(filename, cache_dir)
+        cached_time = time.perf_counter() - t
+
+    t = time.perf_counter()
+    got = [extractor.extract(u) for u in utts]
+    regex_time = time.perf_counter() - t
+
+    for utt, a, b in zip(utts, expected, got):
+        if a != b:
+            mismatches += 1
+            print(f"MISMATCH {lang}: {utt!r} padacioso={a!r} compiled={b!r}")
+
+    print(f"{lang}: {len(utts)} utterances | "
+          f"padacioso {padacioso_time / len(utts) * 1000:.3f} ms/utt | "
+          f"compiled {regex_time / len(utts) * 1000:.4f} ms/utt | "
+          f"compile {compile_time * 1000:.2f} ms, from cache {cached_time * 1000:.2f} ms")
+
+print(f"{mismatches} mismatches")
+sys.exit(1 if mismatches else 0)
@@ -0,0 +1,81 @@
+"""memory held per article by the skill, measured with tracemalloc against the local WikiHow stub
+
+usage: python scripts/benchmark_memory.py [--copies 200] [--steps 12]
+
+    cached        article returned by get_how_to on a cache hit
+    translated    article returned by get_how_to for a language wikihow does not have, translations memoized
+    session       article kept in session_results once read until the end
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+from os.path import dirname
+
+sys.path.insert(0, dirname(__file__))
+import stub_server  # noqa: E402
+from stub_server import StubWikiHow, import_skill, point_wikihow_to  # noqa: E402
+
+SKILL_ID = "ovos-skill-wikihow.openvoiceos"
+
+
+class FakeTranslator:
+    def translate(self, text, target=None, source=None):
+        return text[::-1]
+
+
+def per_copy(make, copies):
+    """bytes allocated and still held per object returned by make()"""
+    make()  # warm up caches and lazy imports outside the measurement
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [make() for _ in range(copies)]
+    size = (tracemalloc.get_traced_memory()[0] - before) / copies
+    tracemalloc.stop()
+    del kept
+    return round(size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--copies", type=int, default=200, help="articles kept alive per measurement")
+    parser.add_argument("--steps", type=int, default=12, help="steps per stub article")
+    args = parser.parse_args()
+
+    page = stub_server.article_page
+    stub_server.article_page = lambda base, slug, n_steps=args.steps: page(base, slug, n_steps)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["XDG_CACHE_HOME"] = cache_dir
+        module = import_skill()
+        from ovos_utils.fakebus import FakeBus
+        from ovos_bus_client.session import SessionManager
+
+        server = StubWikiHow().start()
+        point_wikihow_to(server.base_url)
+        skill = module.WikiHowSkill(skill_id=SKILL_ID, bus=FakeBus())
+        skill.translator = FakeTranslator()
+        skill.speak = skill.speak_dialog = lambda *a, **k: None
+        skill.gui.show_image = skill.gui.release = lambda *a, **k: None
+        skill.images = None  # reading does not wait for picture downloads, they would still be in flight
+        query = "boil an egg"
+        skill.get_how_to(query, lang="en-us")  # cached from now on
+
+        def session():
+            sess = SessionManager.get()
+            skill.speak_how_to(skill.get_how_to(query, lang="en-us"), sess)
+            return skill.session_results.pop(sess.session_id)
+
+        results = {"cached": per_copy(lambda: skill.get_how_to(query, lang="en-us"), args.copies),
+                   "translated": per_copy(lambda: skill.get_how_to(query, lang="xx"), args.copies),
+                   "session": per_copy(session, args.copies)}
+        skill.shutdown()
+        server.stop()
+
+    print(json.dumps({"steps": args.steps, "bytes_per_article": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
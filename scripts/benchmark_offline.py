@@ -0,0 +1,53 @@
+"""build an offline index from the fixture corpus and check search results and latency
+
+runs fully offline, fails if a query does not return the expected article
+"""
+import statistics
+import sys
+import tempfile
+import time
+from os.path import dirname
+
+sys.path.insert(0, dirname(dirname(__file__)))
+from offline import OfflineWikiHow, build_index, read_corpus  # noqa: E402
+
+CORPUS = f"{dirname(__file__)}/fixtures/corpus_en.jsonl"
+EXPECTED = {
+    "how to boil an egg": "Boil an Egg",
+    "how do i peel a boiled egg": "Peel a Boiled Egg",
+    "steps for scrambled eggs": "Make Scrambled Eggs",
+    "how can i tie a tie": "Tie a Tie",
+    "how to change a flat tire": "Change a Flat Tire",
+    "how to make pancakes": "Make Pancakes",
+    "how to fly a kite": None,
+}
+ROUNDS = 200
+
+failures = 0
+with tempfile.TemporaryDirectory() as path:
+    t = time.perf_counter()
+    n = build_index(read_corpus(CORPUS), f"{path}/en")
+    build_time = time.perf_counter() - t
+
+    t = time.perf_counter()
+    offline = OfflineWikiHow(path)
+    offline.get_index("en")
+    open_time = time.perf_counter() - t
+
+    timings = []
+    for query, expected in EXPECTED.items():
+        for _ in range(ROUNDS):
+            t = time.perf_counter()
+            article = offline.get_how_to(query, "en")
+            timings.append(time.perf_counter() - t)
+        title = article["title"] if article else None
+        if title != expected:
+            failures += 1
+            print(f"FAIL {query!r}: expected {expected!r}, got {title!r}")
+
+timings.sort()
+print(f"{n} articles | build {build_time * 1000:.1f} ms | open {open_time * 1000:.2f} ms | "
+      f"query p50 {statistics.median(timings) * 1000:.3f} ms, "
+      f"p99 {timings[int(len(timings) * 0.99)] * 1000:.3f} ms")
+print(f"{failures} failures")
+sys.exit(1 if failures else 0)
@@ -0,0 +1,48 @@
+"""report how long the skill takes to import and load, and which heavy dependencies get imported
+
+usage: python scripts/benchmark_startup.py [path/to/skill/checkout]
+
+runs in a fresh interpreter per sample so import caching does not hide the cost
+"""
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from os.path import abspath, dirname
+
+SAMPLES = 5
+HEAVY = ["pywikihow", "bs4", "requests_cache", "quebra_frases", "padacioso", "simplematch"]
+
+PROBE = """
+import json, os, sys, time
+sys.path.insert(0, {pkgs!r})
+os.environ["XDG_CACHE_HOME"] = {cache!r}
+# framework imports are paid by every skill, keep them out of the measurement
+import ovos_workshop.skills.ovos, ovos_workshop.decorators, ovos_plugin_manager.templates.solvers
+t = time.perf_counter()
+import ovos_skill_wikihow
+imported = time.perf_counter() - t
+from ovos_utils.fakebus import FakeBus
+t = time.perf_counter()
+skill = ovos_skill_wikihow.WikiHowSkill(skill_id="ovos-skill-wikihow.openvoiceos", bus=FakeBus())
+loaded = time.perf_counter() - t
+heavy = [m for m in {heavy!r} if m in sys.modules]
+skill.shutdown()
+print(json.dumps({{"import": imported, "load": loaded, "heavy": heavy}}))
+"""
+
+with tempfile.TemporaryDirectory() as pkgs, tempfile.TemporaryDirectory() as cache:
+    # expose the repo under its package name
+    import os
+    repo = sys.argv[1] if len(sys.argv) > 1 else dirname(dirname(__file__))
+    os.symlink(abspath(repo), f"{pkgs}/ovos_skill_wikihow")
+    probe = PROBE.format(pkgs=pkgs, cache=cache, heavy=HEAVY)
+    runs = []
+    for _ in range(SAMPLES):
+        out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        runs.append(json.loads([l for l in out.stdout.split("\n") if l.startswith("{")][-1]))
+
+print(f"import:  {statistics.median(r['import'] for r in runs) * 1000:.1f} ms (median of {SAMPLES})")
+print(f"load:    {statistics.median(r['load'] for r in runs) * 1000:.1f} ms (median of {SAMPLES})")
+print(f"heavy dependencies imported at load: {', '.join(runs[-1]['heavy']) or 'none'}")
@@ -0,0 +1,166 @@
+"""local stand-in for wikihow.com used by the benchmark scripts
+
+serves a search page and articles in the same markup pywikihow parses, and counts
+the TCP connections it accepted so HTTP keep-alive can be checked
+
+pages recorded from wikihow.com are replayed instead of the generated ones when a
+pages directory is given, record them with (needs network access):
+
+    python scripts/stub_server.py record scripts/fixtures/pages "boil an egg" "tie a tie"
+"""
+import importlib.util
+import os
+import socket
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os.path import abspath, dirname, isfile, join
+from urllib.parse import parse_qs, urlparse
+
+
+def import_skill():
+    """import the repo as the installed package would be named, so relative imports work"""
+    if "ovos_skill_wikihow" in sys.modules:
+        return sys.modules["ovos_skill_wikihow"]
+    repo = dirname(dirname(abspath(__file__)))
+    spec = importlib.util.spec_from_file_location("ovos_skill_wikihow", f"{repo}/__init__.py",
+                                                  submodule_search_locations=[repo])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["ovos_skill_wikihow"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def point_wikihow_to(base_url, lang="en"):
+    """make searches in lang go to the stub server"""
+    from pywikihow import WikiHow
+    WikiHow.lang2url[lang] = base_url + "/"
+
+
+ARTICLES = ["Boil-an-Egg", "Peel-a-Boiled-Egg", "Make-Scrambled-Eggs", "Poach-an-Egg"]
+
+
+def search_page(base_url, query):
+    links = "\n".join(f'<a class="result_link" href="{base_url}/{slug}">'
+                      f'<div class="result_title">How to {slug.replace("-", " ")}</div></a>'
+                      for slug in ARTICLES)
+    return f"<html><body><h2>Results for {query}</h2>{links}</body></html>"
+
+
+def article_page(base_url, slug, n_steps=8):
+    title = slug.replace("-", " ")
+    steps = "\n".join(f'<div class="step"><b>Step {i} of {title}.</b> '
+                      f'Do the thing number {i} carefully (see below). '
+                      f'Then check the result before going on.<sup>[{i}]</sup></div>'
+                      for i in range(1, n_steps + 1))
+    pictures = "\n".join(f'<a class="image"><img data-src="{base_url}/images/{slug}-{i}.jpg"></a>'
+                         for i in range(1, n_steps + 1))
+    return (f'<html><body><h1 class="title_lg"><a href="{base_url}/{slug}">{title}</a></h1>'
+            f'<div class="mf-section-0">Learning how to {title.lower()} is easy.<sup>1</sup></div>'
+            f'{steps}{pictures}</body></html>')
+
+
+def record_pages(out_dir, queries, n_articles=3):
+    """save the search page of every query and its first articles, for replay with pages_dir"""
+    from bs4 import BeautifulSoup
+    net = import_skill().net
+    os.makedirs(out_dir, exist_ok=True)
+    for query in queries:
+        html = net.get_html("https://www.wikihow.com/wikiHowTo?search=" + query.replace(" ", "+"))
+        with open(join(out_dir, "search-" + query.replace(" ", "-") + ".html"), "wb") as f:
+            f.write(html)
+        links = BeautifulSoup(html, "html.parser").find_all("a", class_="result_link")
+        for link in links[:n_articles]:
+            slug = link["href"].rstrip("/").split("/")[-1]
+            with open(join(out_dir, slug + ".html"), "wb") as f:
+                f.write(net.get_html("https://www.wikihow.com/" + slug))
+
+
+class StubWikiHow(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, delay=0.0, pages_dir=None):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.delay = delay
+        self.pages_dir = pages_dir
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def recorded(self, name):
+        """a recorded page with its links pointing to the stub, None if not recorded"""
+        if not self.pages_dir or not isfile(join(self.pages_dir, name)):
+            return None
+        with open(join(self.pages_dir, name), encoding="utf-8") as f:
+            html = f.read()
+        for prefix in ("https://www.wikihow.com", "http://www.wikihow.com", "//www.wikihow.com"):
+            html = html.replace(prefix, self.base_url)
+        return html
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        super().setup()
+        # headers and body are sent separately, without this Nagle + delayed ACK add ~40 ms per request
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server._lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        import time
+        with self.server._lock:
+            self.server.requests += 1
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        url = urlparse(self.path)
+        base = self.server.base_url
+        slug = url.path.strip("/")
+        if url.path.startswith("/wikiHowTo"):
+            query = parse_qs(url.query).get("search", [""])[0]
+            body = self.server.recorded("search-" + query.replace(" ", "-") + ".html") or \
+                search_page(base, query)
+        elif self.server.recorded(slug + ".html") is not None:
+            body = self.server.recorded(slug + ".html")
+        elif slug in ARTICLES:
+            body = article_page(base, slug)
+        elif slug.startswith("images/"):
+            with open(join(dirname(abspath(__file__)), "fixtures", "step.jpg"), "rb") as f:
+                self._send(f.read(), "image/jpeg")
+            return
+        else:
+            self.send_error(404)
+            return
+        self._send(body.encode("utf-8"), "text/html; charset=utf-8")
+
+    def _send(self, data, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "record":
+        record_pages(sys.argv[2], sys.argv[3:])
+    else:
+        server = StubWikiHow(pages_dir=sys.argv[1] if len(sys.argv) > 1 else None)
+        print(f"serving WikiHow stub on {server.base_url}")
+        server.serve_forever()
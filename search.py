@@ -0,0 +1,176 @@
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .net import get_html
+
+
+class SearchResult:
+    """
+    Lightweight WikiHow search result, parsed from the search page only.
+    """
+    __slots__ = ("title", "url", "lang")
+
+    def __init__(self, title: str, url: str, lang: str = "en") -> None:
+        self.title = title
+        self.url = url
+        self.lang = lang
+
+    def __repr__(self) -> str:
+        return f"SearchResult({self.title!r}, {self.url!r})"
+
+    def as_dict(self) -> Dict[str, str]:
+        return {"title": self.title, "url": self.url, "lang": self.lang}
+
+
+def search_results(query: str, lang: str = "en", max_results: int = -1) -> List[SearchResult]:
+    """
+    Search WikiHow without downloading any article.
+
+    Args:
+        query (str): The query string to search for.
+        lang (str, optional): The WikiHow language to search in. Defaults to "en".
+        max_results (int, optional): Maximum number of results, -1 for all. Defaults to -1.
+
+    Returns:
+        List[SearchResult]: Titles and urls of the matching articles.
+    """
+    import bs4
+    from pywikihow import WikiHow
+    from pywikihow.exceptions import UnsupportedLanguage
+
+    lang = lang.split("-")[0].lower()
+    if lang not in WikiHow.lang2url:
+        raise UnsupportedLanguage
+    search_url = WikiHow.lang2url[lang] + "wikiHowTo?search=" + query.replace(" ", "+")
+    html = get_html(search_url)
+    results = []
+    for link in bs4.BeautifulSoup(html, "html.parser").find_all("a", attrs={"class": "result_link"}):
+        url = link.get("href")
+        if not url:
+            continue
+        if url.startswith("//"):
+            url = "http:" + url
+        elif not url.startswith("http"):
+            url = "http://" + url
+        # same title format as pywikihow.HowTo
+        title = url.rstrip("/").split("/")[-1].replace("-", " ")
+        results.append(SearchResult(title, url, lang))
+        if 0 < max_results <= len(results):
+            break
+    return results
+
+
+def parse_article(html: bytes, url: str) -> Dict:
+    """
+    Parse a WikiHow article page with the pywikihow parser.
+
+    Args:
+        html (bytes): The article page html.
+        url (str): The article url.
+
+    Returns:
+        Dict: The article in the same format as ``HowTo.as_dict()``.
+
+    Raises:
+        pywikihow.exceptions.ParseError: if the page is not a valid article
+    """
+    import bs4
+    from pywikihow import HowTo
+    from pywikihow.exceptions import ParseError
+
+    how_to = HowTo(url)
+    try:
+        soup = bs4.BeautifulSoup(html, "html.parser")
+        how_to._parse_title(soup)
+        how_to._parse_intro(soup)
+        how_to._parse_steps(soup)
+        how_to._parse_pictures(soup)
+    except Exception as e:
+        raise ParseError from e
+    how_to._parsed = True
+    return how_to.as_dict()
+
+
+def fetch_article(url: str) -> Dict:
+    """
+    Download and parse a WikiHow article through the shared HTTP session.
+
+    Args:
+        url (str): The article url.
+
+    Returns:
+        Dict: The article in the same format as ``HowTo.as_dict()``.
+
+    Raises:
+        pywikihow.exceptions.ParseError: if the page can not be downloaded or is not a valid article
+    """
+    from pywikihow.exceptions import ParseError
+
+    try:
+        html = get_html(url)
+    except Exception as e:
+        raise ParseError from e
+    return parse_article(html, url)
+
+
+class LazyHowTo(Mapping):
+    """
+    WikiHow article backed by a search result.
+
+    Title and url come from the search result, the article page is only downloaded and parsed
+    the first time its intro, steps or pictures are accessed. Supports read-only dict access
+    with the same keys as ``HowTo.as_dict()``.
+
+    Raises:
+        pywikihow.exceptions.ParseError: if the article page can not be parsed when accessed
+    """
+
+    def __init__(self, result: SearchResult, fetch: Callable[[str], Mapping] = fetch_article) -> None:
+        """
+        Args:
+            result (SearchResult): The search result of the article.
+            fetch (Callable[[str], Mapping]): Downloads and parses the article of an url, returning it
+                in ``HowTo.as_dict()`` format or as an Article. Defaults to fetch_article.
+        """
+        self.result = result
+        self.fetch = fetch
+        self._data: Optional[Mapping] = None
+
+    def __repr__(self) -> str:
+        return f"LazyHowTo({self.result.url!r}, fetched={self.fetched})"
+
+    @property
+    def fetched(self) -> bool:
+        return self._data is not None
+
+    @property
+    def title(self) -> str:
+        return self._data["title"] if self._data else self.result.title
+
+    @property
+    def url(self) -> str:
+        return self.result.url
+
+    def as_dict(self) -> Mapping:
+        """
+        Download and parse the article, if not done yet.
+
+        Returns:
+            Mapping: The article in the same format as ``HowTo.as_dict()``, as returned by fetch.
+        """
+        if self._data is None:
+            self._data = self.fetch(self.result.url)
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "url":
+            return self.url
+        if key == "title":
+            return self.title
+        return self.as_dict()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(("title", "url", "intro", "n_steps", "steps"))
+
+    def __len__(self) -> int:
+        return 5
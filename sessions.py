@@ -0,0 +1,235 @@
+import time
+from collections import OrderedDict
+from threading import Lock, RLock
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from ovos_utils.log import LOG
+
+from .article import Article, Step
+
+
+def compact_step(step: Step) -> Step:
+    """
+    Args:
+        step (Step): A step of an article.
+
+    Returns:
+        Step: The step with only its spoken form, which is all that is needed to read it.
+    """
+    if step.summary is None and step.description is None:
+        return step
+    return Step(step.number, None, None, step.picture, step.spoken_summary, step.spoken_description)
+
+
+class ReadingSteps:
+    """
+    Steps of an article being read. Steps still being produced, eg. translated incrementally
+    by a generator, are pulled from it when first needed and kept, so reading can stop,
+    jump around and resume without fetching or translating any step twice.
+    """
+
+    def __init__(self, steps: Iterable[Step]) -> None:
+        """
+        Args:
+            steps (Iterable[Step]): The steps, may be a generator, only their spoken form is kept.
+        """
+        self._steps: List[Step] = []
+        self._source: Optional[Iterator[Step]] = iter(steps)
+        self._lock = Lock()
+
+    @property
+    def materialized(self) -> List[Step]:
+        """ the steps produced so far """
+        return self._steps
+
+    def get(self, idx: int) -> Optional[Step]:
+        """
+        Args:
+            idx (int): Index of the step, starting at 0.
+
+        Returns:
+            Optional[Step]: The step, None if the article has less steps.
+        """
+        with self._lock:
+            while idx >= len(self._steps) and self._source is not None:
+                step = next(self._source, None)
+                if step is None:
+                    self._source = None
+                else:
+                    self._steps.append(compact_step(step))
+        return self._steps[idx] if 0 <= idx < len(self._steps) else None
+
+    def iter_from(self, start: int = 0) -> Iterator[Step]:
+        """
+        Args:
+            start (int): Index of the first step. Defaults to 0.
+
+        Yields:
+            Step: The steps from start to the end of the article.
+        """
+        idx = start
+        while True:
+            step = self.get(idx)
+            if step is None:
+                return
+            yield step
+            idx += 1
+
+    def __iter__(self) -> Iterator[Step]:
+        return self.iter_from(0)
+
+    def __len__(self) -> int:
+        """ number of steps, produces all of them """
+        self.get(2 ** 31)
+        return len(self._steps)
+
+
+def compact_how_to(how_to: Any) -> Any:
+    """
+    Keep only the parts of an article needed to read it, with the steps wrapped in ReadingSteps.
+
+    Args:
+        how_to (Any): The article, or a not yet resolved future.
+
+    Returns:
+        Any: A compact copy of the article, or how_to unchanged if it is not an article.
+    """
+    if not isinstance(how_to, Article):
+        return how_to
+    steps = how_to.steps
+    return how_to.replace(intro=None, steps=steps if isinstance(steps, ReadingSteps) else ReadingSteps(steps))
+
+
+class SessionStore:
+    """
+    Bounded store of per-session reading state, keyed by session id.
+
+    Entries expire ``ttl`` seconds after they were last accessed, and the least recently
+    used entries are dropped once ``max_entries`` is exceeded, so sessions that lost a
+    common query round or disconnected do not keep their article forever.
+    Entries being read (``reading`` is True) are never dropped, ``on_remove`` is called
+    with the session id and the entry of every expired or evicted session.
+    """
+    DEFAULT_TTL: int = 300
+    DEFAULT_MAX_ENTRIES: int = 50
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 on_remove: Optional[Callable[[str, Dict], None]] = None) -> None:
+        """
+        Args:
+            ttl (float): Seconds an entry is kept after its last access. Defaults to 300.
+            max_entries (int): Maximum number of sessions kept. Defaults to 50.
+            on_remove (Optional[Callable[[str, Dict], None]]): Called for each expired or evicted entry.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.on_remove = on_remove
+        self.expired = 0
+        self.evicted = 0
+        self._lock = RLock()
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._accessed: Dict[str, float] = {}
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        for session_id in list(self._entries):
+            if now - self._accessed[session_id] <= self.ttl:
+                break  # entries are kept in access order
+            if self._entries[session_id].get("reading"):
+                self._touch(session_id)
+                continue
+            LOG.debug(f"WikiHow session expired: {session_id}")
+            self._dropped(session_id)
+            self.expired += 1
+        if len(self._entries) > self.max_entries:
+            idle = [k for k, e in self._entries.items() if not e.get("reading")]
+            for session_id in idle[:len(self._entries) - self.max_entries]:
+                LOG.debug(f"WikiHow session evicted: {session_id}")
+                self._dropped(session_id)
+                self.evicted += 1
+
+    def _dropped(self, session_id: str) -> None:
+        entry = self._remove(session_id)
+        if self.on_remove is not None and entry is not None:
+            try:
+                self.on_remove(session_id, entry)
+            except Exception as e:
+                LOG.error(f"WikiHow session removal callback failed: {e}")
+
+    def _remove(self, session_id: str) -> Optional[Dict]:
+        self._accessed.pop(session_id, None)
+        return self._entries.pop(session_id, None)
+
+    def _touch(self, session_id: str) -> None:
+        self._accessed[session_id] = time.monotonic()
+        self._entries.move_to_end(session_id)
+
+    def __setitem__(self, session_id: str, entry: Dict) -> None:
+        entry = dict(entry)
+        if "how_to" in entry:
+            entry["how_to"] = compact_how_to(entry["how_to"])
+        with self._lock:
+            self._entries[session_id] = entry
+            self._touch(session_id)
+            self._purge()
+
+    def __getitem__(self, session_id: str) -> Dict:
+        entry = self.get(session_id)
+        if entry is None:
+            raise KeyError(session_id)
+        return entry
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge()
+            return len(self._entries)
+
+    def get(self, session_id: str, default: Optional[Dict] = None) -> Optional[Dict]:
+        with self._lock:
+            self._purge()
+            if session_id not in self._entries:
+                return default
+            self._touch(session_id)
+            return self._entries[session_id]
+
+    def touch(self, session_id: str) -> None:
+        """ restart the expiry time of an entry, eg. once it is no longer being read """
+        with self._lock:
+            if session_id in self._entries:
+                self._touch(session_id)
+
+    def pop(self, session_id: str, default: Optional[Dict] = None) -> Optional[Dict]:
+        with self._lock:
+            entry = self._remove(session_id)
+        return default if entry is None else entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._accessed.clear()
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: Number of sessions and stored steps, approximate size of the stored
+                text in characters, and how many sessions expired or were evicted so far.
+        """
+        with self._lock:
+            self._purge()
+            steps = chars = 0
+            for entry in self._entries.values():
+                how_to = entry.get("how_to")
+                if isinstance(how_to, Article) and isinstance(how_to.steps, ReadingSteps):
+                    steps += len(how_to.steps.materialized)
+                    chars += len(how_to.title or "")
+                    for s in how_to.steps.materialized:
+                        chars += len(s.summary or "") + len(s.description or "")
+                        chars += sum(map(len, s.spoken_summary)) + sum(map(len, s.spoken_description))
+            return {"sessions": len(self._entries),
+                    "steps": steps,
+                    "chars": chars,
+                    "expired": self.expired,
+                    "evicted": self.evicted}
@@ -0,0 +1,35 @@
+import re
+from typing import List, Optional
+
+# markup and references that should not be spoken
+_BRACKETS = re.compile(r"\{.*?\}|\[.*?\]|\(.*?\)|<.*?>")
+_URLS = re.compile(r"http\S+|www\S+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize the input text by removing content inside curly braces {}, square brackets [], parentheses (),
+    HTML tags, and URLs. Strips leading/trailing whitespace.
+
+    Args:
+        text (str): Input text to normalize.
+
+    Returns:
+        str: Normalized text.
+    """
+    return _URLS.sub("", _BRACKETS.sub("", text)).strip()
+
+
+def split_sentences(text: Optional[str]) -> List[str]:
+    """
+    Args:
+        text (Optional[str]): Text to speak.
+
+    Returns:
+        List[str]: The normalized, non empty sentences of text.
+    """
+    if not text:
+        return []
+    from quebra_frases import sentence_tokenize
+    return [s for s in sentence_tokenize(normalize_text(text)) if s.strip()]
+
@@ -0,0 +1,176 @@
+import multiprocessing
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, TimeoutError, wait
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ovos_utils.log import LOG
+
+from . import net
+from .article import Article
+from .search import fetch_article, search_results
+
+
+def _init_worker(http: Dict[str, Any], lang2url: Dict[str, str]) -> None:
+    """ runs once in every worker process, before its first task """
+    from pywikihow import WikiHow
+
+    net.configure(**http)
+    WikiHow.lang2url.update(lang2url)  # search the same sites as the parent process
+
+
+def _warm() -> None:
+    """ import the parser in the worker, so the first request does not pay for it """
+    import bs4  # noqa: F401
+    import pywikihow  # noqa: F401
+
+
+def _search(query: str, lang: str, max_results: int) -> List[Dict[str, str]]:
+    return [r.as_dict() for r in search_results(query, lang, max_results)]
+
+
+def _fetch(url: str) -> Article:
+    return Article.from_dict(fetch_article(url))
+
+
+class ParserPool:
+    """
+    Searches and downloads and parses WikiHow articles in worker processes.
+
+    Parsing a full article page is CPU bound and holds the GIL, in a shared solver server it
+    would slow down every other plugin of the process. Workers are started with the pool,
+    a pool broken by a crashed worker is replaced on the next task, and a pool with a task
+    that timed out is terminated and replaced, a running task can not be cancelled otherwise.
+    """
+    DEFAULT_MAX_WORKERS: int = 2
+    DEFAULT_TIMEOUT: float = 20
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 http: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Args:
+            max_workers (int): Worker processes. Defaults to 2.
+            timeout (float): Seconds to wait for the result of a task once the workers are started,
+                including the time it is queued. Defaults to 20.
+            http (Optional[Dict[str, Any]]): Keyword arguments of ``net.configure`` for the workers.
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.http = http or {}
+        # never fork, the parent has threads holding locks (http pool, executors)
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self._lock = Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._warming: List[Future] = []
+        self.tasks = 0
+        self.timeouts = 0
+        self.restarts = 0
+        self._start()
+
+    def _start(self) -> ProcessPoolExecutor:
+        """ start a warm pool, the caller holds the lock or is the constructor """
+        from pywikihow import WikiHow
+
+        executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self._context,
+                                       initializer=_init_worker,
+                                       initargs=(self.http, dict(WikiHow.lang2url)))
+        # every submit with no idle worker starts a new process, so this starts all of them
+        self._warming = [executor.submit(_warm) for _ in range(self.max_workers)]
+        self._executor = executor
+        return executor
+
+    def _restart(self, executor: ProcessPoolExecutor) -> None:
+        """ kill the workers of a pool and start a new one, the caller holds the lock """
+        terminate = getattr(executor, "terminate_workers", None)  # python 3.14+
+        if terminate is not None:
+            terminate()
+        else:
+            processes = list((executor._processes or {}).values())
+            executor.shutdown(wait=False, cancel_futures=True)
+            for process in processes:
+                process.terminate()
+        self.restarts += 1
+        self._start()
+
+    def _submit(self, fn: Callable, *args) -> Tuple[ProcessPoolExecutor, List[Future], Future]:
+        """ submit under the lock, so a restart by another caller can not shut the pool down in between """
+        with self._lock:
+            if self._executor is None:
+                raise RuntimeError("WikiHow parser pool is shut down")
+            self.tasks += 1
+            try:
+                return self._executor, self._warming, self._executor.submit(fn, *args)
+            except RuntimeError:  # BrokenProcessPool, a worker died while idle
+                LOG.warning("WikiHow parser worker died, restarting the pool")
+                self._restart(self._executor)
+                return self._executor, self._warming, self._executor.submit(fn, *args)
+
+    def _run(self, fn: Callable, *args) -> Any:
+        for attempt in range(2):
+            executor, warming, future = self._submit(fn, *args)
+            # the task timeout starts once the workers are up, a pool just restarted is not hung
+            wait(warming)
+            try:
+                return future.result(timeout=self.timeout)
+            except TimeoutError:
+                with self._lock:
+                    self.timeouts += 1
+                    if not future.cancel() and self._executor is executor:
+                        # the task is running, only killing its worker frees the pool
+                        LOG.warning("WikiHow parser task timed out, restarting the pool")
+                        self._restart(executor)
+                raise
+            except (BrokenProcessPool, CancelledError):
+                # a crashed worker, or the pool was restarted after a timeout of another task
+                with self._lock:
+                    if self._executor is executor:
+                        LOG.warning("WikiHow parser worker died, restarting the pool")
+                        self._restart(executor)
+                if attempt:
+                    raise
+
+    def search(self, query: str, lang: str = "en", max_results: int = -1) -> List[Dict[str, str]]:
+        """
+        Args:
+            query (str): The query string to search for.
+            lang (str): The WikiHow language to search in. Defaults to "en".
+            max_results (int): Maximum number of results, -1 for all. Defaults to -1.
+
+        Returns:
+            List[Dict[str, str]]: The results in ``SearchResult.as_dict()`` format.
+
+        Raises:
+            concurrent.futures.TimeoutError: if the search takes longer than the task timeout
+        """
+        return self._run(_search, query, lang, max_results)
+
+    def fetch(self, url: str) -> Article:
+        """
+        Args:
+            url (str): The article url.
+
+        Returns:
+            Article: The parsed article.
+
+        Raises:
+            pywikihow.exceptions.ParseError: if the page can not be downloaded or is not a valid article
+            concurrent.futures.TimeoutError: if the download and parsing take longer than the task timeout
+        """
+        return self._run(_fetch, url)
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: Tasks submitted, tasks timed out and pool restarts so far.
+        """
+        with self._lock:
+            return {"tasks": self.tasks, "timeouts": self.timeouts, "restarts": self.restarts,
+                    "workers": self.max_workers}
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)